@@ -11,6 +11,8 @@ from backend.utils.caching import cached, CacheTTL
 
 logger = logging.getLogger(__name__)
 
+GAME_TYPE_LABELS = ("Main Slate", "Standalone")
+
 
 def _classify_game_type(start_time_dt: pd.Timestamp) -> str:
     """
@@ -60,6 +62,11 @@ def process_game_type(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
 
+    # Skip the timestamp parse when the column is already classified
+    # (upstream nflverse game_type holds REG/POST codes, so check the labels).
+    if 'game_type' in df.columns and df['game_type'].isin(GAME_TYPE_LABELS).mean() > 0.95:
+        return df
+
     try:
         ts = None
         if 'game_datetime' in df.columns:
@@ -84,14 +91,16 @@ def get_game_schedule(df: pd.DataFrame, season: int) -> pd.DataFrame:
     """
     Load season schedule from nflreadpy (more reliable than PBP-derived),
     and classify game_type using gameday + gametime.
-    Returns: game_id, week, game_date, start_time, home_team, away_team, (optional scores), game_type
+    Returns: game_id, week, game_date, start_time, home_team, away_team, (optional scores), game_type,
+    game_date_ts (game_date parsed to datetime64, NaT if unparseable)
     """
     try:
         import nflreadpy as nfl
         schedule = nfl.load_schedules(seasons=[int(season)]).to_pandas()
         schedule['start_time_dt'] = pd.to_datetime(schedule['gameday'] + ' ' + schedule['gametime'], errors='coerce')
         schedule['game_type'] = schedule['start_time_dt'].apply(_classify_game_type)
-        cols = ['game_id', 'week', 'gameday', 'gametime', 'home_team', 'away_team', 'home_score', 'away_score', 'game_type']
+        schedule['game_date_ts'] = pd.to_datetime(schedule['gameday'], errors='coerce')
+        cols = ['game_id', 'week', 'gameday', 'gametime', 'home_team', 'away_team', 'home_score', 'away_score', 'game_type', 'game_date_ts']
         cols = [c for c in cols if c in schedule.columns]
         schedule = schedule[cols].rename(columns={'gameday': 'game_date', 'gametime': 'start_time'})
         return schedule
@@ -188,14 +197,20 @@ def get_first_tds(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@cached(ttl=300)
+@cached(ttl=CacheTTL.NFL_ROSTERS, cache_name="nfl_rosters")
 def load_rosters(season: int) -> pd.DataFrame:
     """
     Load NFL player rosters for a season.
-    Returns DataFrame with player info including full_name, team, position, etc.
+    Returns DataFrame with player info including full_name, team, position, etc.,
+    plus a lowercased full_name_lc column for name lookups.
+    Rosters are semi-static, so this is cached for CacheTTL.NFL_ROSTERS and
+    cleared by invalidate_on_roster_sync().
     """
     try:
         rosters = nfl.load_rosters(seasons=[int(season)]).to_pandas()
+        if 'full_name' in rosters.columns:
+            # Lowercased once here so name lookups don't redo it per call
+            rosters['full_name_lc'] = rosters['full_name'].str.lower()
         return rosters
     except Exception as e:
         logger.error(f"Error loading rosters for {season}: {e}")
@@ -1,6 +1,7 @@
 """Admin Router - Batch Operations and Configuration"""
 from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query
-from typing import List, Dict, Any
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 import logging
 import sqlite3
 import csv
@@ -14,13 +15,16 @@ from backend.config import config
 from backend.services.data_sync import sync_games_for_season, sync_rosters, sync_touchdowns_for_season
 from backend.grading.grading_logic import auto_grade_season
 from backend.database.stats import clear_leaderboard_cache
-from backend.database import add_pick, get_pick, get_user_week_picks
+from backend.database import add_pick, get_db_context, get_pick, get_user_week_picks
 from backend.database.weeks import get_week, get_week_by_season_week, add_week
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+# Per-row messages returned by CSV import; error_count always reports the full total
+MAX_REPORTED_IMPORT_ERRORS = 500
+
 
 @router.post("/sync-games")
 async def admin_sync_games(
@@ -358,87 +362,118 @@ async def batch_grade_picks(
     }
 
 
+def _import_picks_csv(fileobj: BinaryIO, week_id: Optional[int]) -> Tuple[int, List[str]]:
+    """
+    Insert picks from a CSV upload in a single transaction.
+
+    Returns (imported_count, per-row errors). Raises (and rolls back every
+    insert) if the file cannot be decoded or no week can be resolved.
+    """
+    imported_count = 0
+    errors: List[str] = []
+
+    # Decode the spooled upload as it is read rather than copying the
+    # whole body into bytes and again into a str
+    text_stream = io.TextIOWrapper(fileobj, encoding="utf-8", newline="")
+    try:
+        reader = csv.DictReader(text_stream)
+        # A decode error can surface mid-file, after rows were inserted:
+        # commit only once the whole file has been read
+        with get_db_context() as conn:
+            cursor = conn.cursor()
+
+            # If week_id not provided, use current week
+            if not week_id:
+                cursor.execute("SELECT id FROM weeks WHERE started_at <= datetime('now') AND ended_at > datetime('now') LIMIT 1")
+                row = cursor.fetchone()
+                if not row:
+                    raise ValueError("No active week found and week_id not provided")
+                week_id = row[0]
+
+            # Resolve users and the week's existing picks once, instead of two
+            # queries per CSV row
+            cursor.execute("SELECT name, id FROM users")
+            user_ids = {name: user_id for name, user_id in cursor.fetchall()}
+            cursor.execute("SELECT user_id, player_name FROM picks WHERE week_id = ?", (week_id,))
+            existing_picks = {tuple(pick) for pick in cursor.fetchall()}
+
+            for row_idx, row in enumerate(reader, start=2):  # Start at 2 (after header)
+                try:
+                    user_name = row.get("User", "").strip()
+                    player_name = row.get("Player", "").strip()
+                    team = row.get("Team", "").strip()
+                    odds = float(row.get("Odds", 0))
+
+                    if not all([user_name, player_name]):
+                        errors.append(f"Row {row_idx}: Missing User or Player")
+                        continue
+
+                    # Find user
+                    user_id = user_ids.get(user_name)
+                    if user_id is None:
+                        errors.append(f"Row {row_idx}: User '{user_name}' not found")
+                        continue
+
+                    # Check for duplicate (including earlier rows of this file)
+                    if (user_id, player_name) in existing_picks:
+                        errors.append(f"Row {row_idx}: Duplicate pick for {user_name}/{player_name}")
+                        continue
+
+                    # Insert pick
+                    cursor.execute(
+                        """INSERT INTO picks (user_id, week_id, team, player_name, odds)
+                           VALUES (?, ?, ?, ?, ?)""",
+                        (user_id, week_id, team or "Unknown", player_name, odds or None)
+                    )
+                    existing_picks.add((user_id, player_name))
+                    imported_count += 1
+
+                except ValueError as e:
+                    errors.append(f"Row {row_idx}: Invalid odds value - {str(e)}")
+                except Exception as e:
+                    errors.append(f"Row {row_idx}: {str(e)}")
+    finally:
+        # Hand the file back to UploadFile so closing the wrapper doesn't close it
+        text_stream.detach()
+
+    return imported_count, errors
+
+
 @router.post("/csv-import")
 async def import_picks_csv(
     file: UploadFile = File(...),
     week_id: int = None,
     current_user: Dict[str, Any] = Depends(get_current_admin_user),
-    conn: sqlite3.Connection = Depends(get_db_async)
 ) -> Dict[str, Any]:
     """Import picks from CSV file. Columns: User,Player,Team,Odds (Team optional)"""
-    cursor = conn.cursor()
-    imported_count = 0
-    errors = []
-    
     try:
-        contents = await file.read()
-        text_stream = io.StringIO(contents.decode("utf-8"))
-        reader = csv.DictReader(text_stream)
-        
-        # If week_id not provided, use current week
-        if not week_id:
-            cursor.execute("SELECT id FROM weeks WHERE started_at <= datetime('now') AND ended_at > datetime('now') LIMIT 1")
-            row = cursor.fetchone()
-            if not row:
-                raise ValueError("No active week found and week_id not provided")
-            week_id = row[0]
-        
-        for row_idx, row in enumerate(reader, start=2):  # Start at 2 (after header)
-            try:
-                user_name = row.get("User", "").strip()
-                player_name = row.get("Player", "").strip()
-                team = row.get("Team", "").strip()
-                odds = float(row.get("Odds", 0))
-                
-                if not all([user_name, player_name]):
-                    errors.append(f"Row {row_idx}: Missing User or Player")
-                    continue
-                
-                # Find user
-                cursor.execute("SELECT id FROM users WHERE name = ?", (user_name,))
-                user_row = cursor.fetchone()
-                if not user_row:
-                    errors.append(f"Row {row_idx}: User '{user_name}' not found")
-                    continue
-                
-                user_id = user_row[0]
-                
-                # Check for duplicate
-                cursor.execute(
-                    "SELECT id FROM picks WHERE user_id = ? AND week_id = ? AND player_name = ?",
-                    (user_id, week_id, player_name)
-                )
-                if cursor.fetchone():
-                    errors.append(f"Row {row_idx}: Duplicate pick for {user_name}/{player_name}")
-                    continue
-                
-                # Insert pick
-                cursor.execute(
-                    """INSERT INTO picks (user_id, week_id, team, player_name, odds)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (user_id, week_id, team or "Unknown", player_name, odds or None)
-                )
-                imported_count += 1
-                
-            except ValueError as e:
-                errors.append(f"Row {row_idx}: Invalid odds value - {str(e)}")
-            except Exception as e:
-                errors.append(f"Row {row_idx}: {str(e)}")
-        
-        conn.commit()
-        logger.info(f"Admin {current_user['name']} imported {imported_count} picks from CSV")
-        
-        return {
-            "success": True,
-            "imported_count": imported_count,
-            "error_count": len(errors),
-            "errors": errors if errors else None
-        }
-        
+        await file.seek(0)
+        # File reads and inserts are blocking; keep them off the event loop
+        imported_count, errors = await run_in_threadpool(_import_picks_csv, file.file, week_id)
+    except UnicodeDecodeError as e:
+        logger.error(f"CSV import error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"CSV import failed: file is not valid UTF-8 (byte {e.start}); no picks were imported",
+        )
     except Exception as e:
         logger.error(f"CSV import error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"CSV import failed: {str(e)}")
 
+    logger.info(f"Admin {current_user['name']} imported {imported_count} picks from CSV")
+
+    # A bad file can fail on every row; keep the response bounded
+    reported_errors = errors[:MAX_REPORTED_IMPORT_ERRORS]
+    if len(errors) > MAX_REPORTED_IMPORT_ERRORS:
+        reported_errors.append(f"... {len(errors) - MAX_REPORTED_IMPORT_ERRORS} more errors")
+
+    return {
+        "success": True,
+        "imported_count": imported_count,
+        "error_count": len(errors),
+        "errors": reported_errors if errors else None
+    }
+
 
 @router.get("/logs")
 async def get_admin_logs(
@@ -107,6 +107,9 @@ APP_VERSION = _CONFIG.get("app", {}).get("version", "1.0.0")
 CURRENT_SEASON = _CONFIG.get("app", {}).get("current_season", 2025)
 CURRENT_WEEK = _CONFIG.get("app", {}).get("current_week", 1)  # Default to week 1
 DATABASE_PATH = _CONFIG.get("app", {}).get("database_path", "data/fast6.db")
+# Relative cache_dir values resolve against the project root, not the working directory
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = str(_PROJECT_ROOT / _CONFIG.get("app", {}).get("cache_dir", "data/cache"))
 
 # ===== SEASONS =====
 SEASONS = _CONFIG.get("seasons", [2025, 2024, 2023, 2022, 2021, 2020])
@@ -171,6 +174,7 @@ ODDS_API_MARKET = _api_config.get("market", "player_anytime_td")
 ODDS_API_REGIONS = _api_config.get("regions", "us")
 ODDS_API_FORMAT = _api_config.get("format", "american")
 ODDS_API_CACHE_TTL = _api_config.get("cache_ttl", 3600)
+ODDS_API_BATCH_SIZE = _api_config.get("batch_size", 20)
 
 # ===== API RESILIENCE CONFIGURATION =====
 _retry_config = _api_root.get("retry", {})
@@ -178,6 +182,7 @@ API_RETRY_RETRIES = _retry_config.get("retries", 3)
 API_RETRY_BACKOFF_BASE = _retry_config.get("backoff_base_seconds", 0.5)
 API_RETRY_BACKOFF_FACTOR = _retry_config.get("backoff_factor", 2.0)
 API_RETRY_JITTER = _retry_config.get("jitter_seconds", 0.1)
+API_RETRY_BACKOFF_CAP = _retry_config.get("backoff_cap_seconds", 8.0)
 
 _breaker_config = _api_root.get("circuit_breaker", {})
 API_BREAKER_FAILURE_THRESHOLD = _breaker_config.get("failure_threshold", 5)
@@ -190,7 +195,8 @@ POLYMARKET_GAMMA_URL = _polymarket_config.get("gamma_base_url", "https://gamma-a
 POLYMARKET_CLOB_URL = _polymarket_config.get("clob_base_url", "https://clob.polymarket.com")
 POLYMARKET_DATA_URL = _polymarket_config.get("data_base_url", "https://data-api.polymarket.com")
 POLYMARKET_CACHE_TTL = _polymarket_config.get("cache_ttl", 3600)
-POLYMARKET_KEYWORDS = _polymarket_config.get("search_keywords", ["NFL", "first touchdown"])
+POLYMARKET_REQUEST_BUDGET_SECONDS = _polymarket_config.get("request_budget_seconds", 20)
+POLYMARKET_RATE_LIMIT = _polymarket_config.get("rate_limit_per_second", 20)
 
 # ===== KALSHI API CONFIGURATION =====
 _kalshi_config = _CONFIG.get("api", {}).get("kalshi", {})
@@ -198,6 +204,7 @@ KALSHI_ENABLED = _kalshi_config.get("enabled", False)
 KALSHI_BASE_URL = _kalshi_config.get("base_url", "https://trading-api.kalshi.com/trade-api/v2")
 KALSHI_CACHE_TTL = _kalshi_config.get("cache_ttl", 3600)
 KALSHI_EVENT_CATEGORIES = _kalshi_config.get("event_categories", ["NFL", "football"])
+KALSHI_RATE_LIMIT = _kalshi_config.get("rate_limit_per_second", 10)
 
 # Kalshi API key (optional - public endpoints work without auth)
 KALSHI_API_KEY = os.getenv("KALSHI_API_KEY", "")
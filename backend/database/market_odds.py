@@ -232,6 +232,47 @@ def add_market_outcome(
         return cursor.lastrowid
 
 
+def add_market_outcomes_batch(records: List[Dict]) -> int:
+    """
+    Record multiple market outcomes in one transaction.
+
+    Args:
+        records: List of dicts with keys:
+            source, game_id, market_id, player_name, resolved_outcome,
+            actual_first_td_scorer (optional), resolution_time (optional)
+
+    Returns:
+        Number of records written
+    """
+    if not records:
+        return 0
+
+    with get_db_context() as conn:
+        cursor = conn.cursor()
+
+        insert_data = [
+            (
+                r['source'],
+                r['game_id'],
+                r['market_id'],
+                r['player_name'],
+                r['resolved_outcome'],
+                r.get('actual_first_td_scorer'),
+                r.get('resolution_time')
+            )
+            for r in records
+        ]
+
+        cursor.executemany("""
+            INSERT OR REPLACE INTO market_outcomes
+            (source, game_id, market_id, player_name, resolved_outcome,
+             actual_first_td_scorer, resolution_time)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, insert_data)
+
+        return cursor.rowcount
+
+
 def get_market_outcomes_for_game(game_id: str) -> List[Dict]:
     """Get all market outcomes for a specific game."""
     with get_db_context() as conn:
@@ -3,10 +3,30 @@ Pick Validation Utilities
 Validates picks before saving to ensure data integrity.
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, NamedTuple, Optional, Tuple, Union
 from datetime import datetime
+from functools import partial
+import difflib
+import numpy as np
 import pandas as pd
 from backend.database import get_user_week_picks
+from backend.utils.roster_index import (
+    get_roster_index,
+    lowercase_roster_names,
+    roster_index_extras,
+)
+
+_MISSING = object()
+
+# Year shown in roster-miss warnings; fixed at import so batches don't re-query the clock
+_CURRENT_YEAR = datetime.now().year
+
+
+class _RosterNameHints(NamedTuple):
+    """Lookups for "did you mean" suggestions, built on the first roster miss."""
+    display_names: Dict[str, str]
+    by_initial: Dict[str, List[str]]
+    by_last_name: Dict[str, List[str]]
 
 
 class PickValidationError(Exception):
@@ -19,6 +39,128 @@ class PickValidationWarning(Exception):
     pass
 
 
+class ExistingPickIndex(NamedTuple):
+    """A user's existing picks for one week, keyed for the duplicate checks (values are game_ids)."""
+    game_by_team: Dict[str, Optional[str]]
+    game_by_player: Dict[str, Optional[str]]
+
+
+def build_existing_pick_index(existing_picks: List[Dict]) -> ExistingPickIndex:
+    """
+    Index existing picks by team and lowercased player name.
+
+    Args:
+        existing_picks: Pick dicts as returned by get_user_week_picks
+
+    Returns:
+        ExistingPickIndex; the first pick wins when several share a key
+    """
+    game_by_team: Dict[str, Optional[str]] = {}
+    game_by_player: Dict[str, Optional[str]] = {}
+    for pick in existing_picks:
+        game_id = pick.get('game_id')
+        game_by_team.setdefault(pick.get('team'), game_id)
+        game_by_player.setdefault((pick.get('player_name') or '').lower(), game_id)
+    return ExistingPickIndex(game_by_team, game_by_player)
+
+
+def _build_roster_name_hints(
+    roster_index: Dict[str, Tuple[str, ...]],
+    roster_df: pd.DataFrame
+) -> _RosterNameHints:
+    """Map lowercased names to their roster spelling and bucket them by initial and last name."""
+    display_names: Dict[str, str] = {}
+    if 'full_name' in roster_df.columns:
+        for name_lc, name in zip(lowercase_roster_names(roster_df).to_numpy(), roster_df['full_name'].to_numpy()):
+            if isinstance(name_lc, str):
+                display_names.setdefault(name_lc, name)
+
+    by_initial: Dict[str, List[str]] = {}
+    by_last_name: Dict[str, List[str]] = {}
+    for name_lc in roster_index:
+        tokens = name_lc.split()
+        if not tokens:
+            continue
+        by_initial.setdefault(name_lc[0], []).append(name_lc)
+        by_last_name.setdefault(tokens[-1], []).append(name_lc)
+    return _RosterNameHints(display_names, by_initial, by_last_name)
+
+
+def _get_roster_name_hints(
+    roster_index: Dict[str, Tuple[str, ...]],
+    roster_df: pd.DataFrame
+) -> _RosterNameHints:
+    """Return name hints for roster_df, cached alongside its roster index."""
+    extras = roster_index_extras(roster_df, roster_index)
+    if extras is None:
+        return _build_roster_name_hints(roster_index, roster_df)
+    hints = extras.get('name_hints')
+    if hints is None:
+        hints = extras['name_hints'] = _build_roster_name_hints(roster_index, roster_df)
+    return hints
+
+
+def _suggest_roster_name(
+    pname_lc: str,
+    roster_index: Dict[str, Tuple[str, ...]],
+    roster_df: pd.DataFrame
+) -> Optional[str]:
+    """Return the roster spelling of the closest name to pname_lc, if any is close enough."""
+    tokens = pname_lc.split()
+    if not tokens:
+        return None
+    hints = _get_roster_name_hints(roster_index, roster_df)
+    # A typo close enough to suggest almost always keeps either the first
+    # letter or the last name; only those names go through difflib
+    candidates = dict.fromkeys(hints.by_initial.get(pname_lc[0], ()))
+    candidates.update(dict.fromkeys(hints.by_last_name.get(tokens[-1], ())))
+    matches = difflib.get_close_matches(pname_lc, candidates, n=1, cutoff=0.85)
+    if not matches:
+        return None
+    return hints.display_names.get(matches[0], matches[0])
+
+
+def build_game_index(schedule_df: pd.DataFrame) -> Dict[str, Tuple[str, str, np.datetime64]]:
+    """
+    Build a game_id -> (home_team, away_team, game_date) lookup from a schedule.
+
+    Uses the game_date_ts column when the schedule already carries it;
+    otherwise game_date is parsed for the whole column at once into
+    datetime64[ns] (timezone-aware values are converted to naive UTC).
+    Unparseable dates become NaT, which never compares as started.
+
+    Args:
+        schedule_df: NFL schedule DataFrame with game_id, home_team, away_team, game_date
+
+    Returns:
+        Dict mapping game_id to (home_team, away_team, game_date) for the first
+        schedule row of each game
+    """
+    if schedule_df.empty:
+        return {}
+
+    games = schedule_df.drop_duplicates('game_id')
+    if 'game_date_ts' in games.columns and pd.api.types.is_datetime64_dtype(games['game_date_ts']):
+        # Already parsed at ingest (get_game_schedule)
+        game_dates = games['game_date_ts']
+    elif 'game_date' in games.columns:
+        game_dates = pd.to_datetime(games['game_date'], errors='coerce', format='mixed')
+        if not pd.api.types.is_datetime64_dtype(game_dates):
+            # Timezone-aware (or mixed-offset) values: normalize to naive UTC
+            game_dates = pd.to_datetime(games['game_date'], errors='coerce', format='mixed', utc=True).dt.tz_localize(None)
+    else:
+        game_dates = pd.Series(pd.NaT, index=games.index, dtype='datetime64[ns]')
+
+    return dict(zip(
+        games['game_id'].to_numpy(),
+        zip(
+            games['home_team'].to_numpy(),
+            games['away_team'].to_numpy(),
+            game_dates.to_numpy(dtype='datetime64[ns]'),
+        ),
+    ))
+
+
 def validate_pick(
     player_name: str,
     team: str,
@@ -28,11 +170,19 @@ def validate_pick(
     week_id: int,
     roster_df: pd.DataFrame,
     schedule_df: pd.DataFrame,
-    existing_picks: Optional[List[Dict]] = None
+    existing_picks: Optional[Union[List[Dict], ExistingPickIndex]] = None,
+    roster_index: Optional[Dict[str, Tuple[str, ...]]] = None,
+    game_index: Optional[Dict[str, Tuple[str, str, np.datetime64]]] = None,
+    now: Optional[np.datetime64] = None,
+    stop_on_error: bool = False
 ) -> Tuple[List[str], List[str]]:
     """
     Validate a pick before saving to database.
     
+    Checks run cheapest first: name, team, game and odds are dict/scalar
+    checks, the roster lookup may fall back to a fuzzy search, and the
+    duplicate check may query the database.
+    
     Args:
         player_name: Name of player being picked
         team: Team abbreviation
@@ -42,7 +192,17 @@ def validate_pick(
         week_id: Week ID from backend.database
         roster_df: NFL roster DataFrame
         schedule_df: NFL schedule DataFrame
-        existing_picks: List of existing picks for this user/week
+        existing_picks: List of existing picks for this user/week, or an
+            ExistingPickIndex built from them
+        roster_index: Prebuilt lookup from build_roster_index (built from
+            roster_df and cached per frame when omitted)
+        game_index: Prebuilt lookup from build_game_index (built from
+            schedule_df when omitted)
+        now: Reference time for the game-started check (defaults to the
+            current local time)
+        stop_on_error: Return as soon as the cheap checks (name, team, game,
+            odds) produce an error, skipping the roster lookup and the
+            existing-pick query
     
     Returns:
         Tuple of (errors, warnings)
@@ -61,66 +221,45 @@ def validate_pick(
     errors = []
     warnings = []
     
-    # 1. Check if player name is provided
-    if not player_name or player_name.strip() == "" or player_name == "None":
+    # 1. Check if player name is provided (isspace() avoids a strip() copy)
+    if not player_name or player_name == "None" or player_name.isspace():
         errors.append("Player name is required")
         return errors, warnings
     
+    pname_lc = player_name.lower()
+    is_dst = player_name.endswith(" D/ST")
+    
     # 2. Check if team is valid
     if not team or team == "Unknown":
         errors.append("Team must be specified")
     
-    # 3. Validate player exists in roster (if not D/ST)
-    if not player_name.endswith(" D/ST"):
-        if not roster_df.empty:
-            # Try to find player in roster
-            player_match = roster_df[
-                roster_df['full_name'].str.lower() == player_name.lower()
-            ]
-            
-            if player_match.empty:
-                warnings.append(f"Player '{player_name}' not found in {datetime.now().year} roster")
-            else:
-                # Check if player's team matches pick team
-                player_teams = player_match['team'].unique()
-                if team not in player_teams:
-                    warnings.append(
-                        f"Player team mismatch: {player_name} plays for "
-                        f"{', '.join(player_teams)}, not {team}"
-                    )
-    
-    # 4. Validate game exists in schedule
-    if not schedule_df.empty:
-        game_match = schedule_df[schedule_df['game_id'] == game_id]
+    # 3. Validate game exists in schedule
+    if game_index is None:
+        game_index = build_game_index(schedule_df)
+    if game_index:
+        game = game_index.get(game_id)
         
-        if game_match.empty:
+        if game is None:
             errors.append(f"Game ID '{game_id}' not found in schedule")
         else:
-            game = game_match.iloc[0]
+            home_team, away_team, game_date = game
             
-            # Check if game has already started
-            try:
-                game_date = pd.to_datetime(game['game_date'])
-                now = datetime.now()
-                
-                if game_date < now:
-                    warnings.append(
-                        f"Game already started on {game_date.strftime('%m/%d/%Y %H:%M')}"
-                    )
-            except Exception:
-                pass  # Skip date check if parsing fails
+            # Check if game has already started (NaT compares False)
+            if now is None:
+                now = np.datetime64(datetime.now(), 'ns')
+            if game_date < now:
+                warnings.append(
+                    f"Game already started on {pd.Timestamp(game_date).strftime('%m/%d/%Y %H:%M')}"
+                )
             
             # Check if team is actually playing in this game
-            home_team = game['home_team']
-            away_team = game['away_team']
-            
             if team not in [home_team, away_team]:
                 errors.append(
                     f"Team {team} is not playing in this game "
                     f"({away_team} @ {home_team})"
                 )
     
-    # 5. Validate odds
+    # 4. Validate odds
     if odds is not None:
         if odds == 0:
             warnings.append("Odds are 0 - this is unusual")
@@ -129,27 +268,56 @@ def validate_pick(
     else:
         warnings.append("No odds provided - theoretical return will be $0")
     
+    # Errors so far already block saving; skip the roster and duplicate work
+    if errors and stop_on_error:
+        return errors, warnings
+    
+    # 5. Validate player exists in roster (if not D/ST)
+    if not is_dst:
+        if roster_index is None:
+            roster_index = get_roster_index(roster_df)
+        if roster_index:
+            # Try to find player in roster
+            player_teams = roster_index.get(pname_lc)
+            
+            if player_teams is None:
+                message = f"Player '{player_name}' not found in {_CURRENT_YEAR} roster"
+                suggestion = _suggest_roster_name(pname_lc, roster_index, roster_df)
+                if suggestion:
+                    message = f"{message} (did you mean '{suggestion}'?)"
+                warnings.append(message)
+            else:
+                # Check if player's team matches pick team
+                if team not in player_teams:
+                    warnings.append(
+                        f"Player team mismatch: {player_name} plays for "
+                        f"{', '.join(player_teams)}, not {team}"
+                    )
+    
     # 6. Check for duplicate picks
     if existing_picks is None and week_id and user_id:
         existing_picks = get_user_week_picks(user_id, week_id)
     
     if existing_picks:
+        if not isinstance(existing_picks, ExistingPickIndex):
+            existing_picks = build_existing_pick_index(existing_picks)
+
         # Check if user already has a pick for this team
-        for pick in existing_picks:
-            if pick.get('team') == team:
-                # Same game, might be updating
-                if pick.get('game_id') == game_id:
-                    warnings.append(f"Updating existing pick for {team}")
-                else:
-                    errors.append(f"User already has a pick for {team} in a different game")
-            
-            # Check if picking same player twice
-            existing_player = pick.get('player_name', '')
-            if existing_player.lower() == player_name.lower():
-                if pick.get('game_id') == game_id:
-                    warnings.append(f"Updating existing pick for {player_name}")
-                else:
-                    warnings.append(f"User is picking {player_name} in multiple games")
+        team_game = existing_picks.game_by_team.get(team, _MISSING)
+        if team_game is not _MISSING:
+            # Same game, might be updating
+            if team_game == game_id:
+                warnings.append(f"Updating existing pick for {team}")
+            else:
+                errors.append(f"User already has a pick for {team} in a different game")
+
+        # Check if picking same player twice
+        player_game = existing_picks.game_by_player.get(pname_lc, _MISSING)
+        if player_game is not _MISSING:
+            if player_game == game_id:
+                warnings.append(f"Updating existing pick for {player_name}")
+            else:
+                warnings.append(f"User is picking {player_name} in multiple games")
     
     return errors, warnings
 
@@ -177,18 +345,38 @@ def validate_pick_batch(
         ...         print(f"Pick {idx} has errors: {errors}")
     """
     results = {}
+    # Roster, schedule and clock are fixed for the batch: bind them once
+    validate = partial(
+        validate_pick,
+        roster_df=roster_df,
+        schedule_df=schedule_df,
+        roster_index=get_roster_index(roster_df),
+        game_index=build_game_index(schedule_df),
+        now=np.datetime64(datetime.now(), 'ns'),
+    )
+    # Existing picks fetched once per (user, week) instead of once per pick
+    existing_by_user_week: Dict[Tuple[int, int], ExistingPickIndex] = {}
     
     for idx, pick in enumerate(picks):
-        errors, warnings = validate_pick(
+        user_id = pick.get('user_id')
+        week_id = pick.get('week_id')
+        existing_picks = None
+        if user_id and week_id:
+            key = (user_id, week_id)
+            if key not in existing_by_user_week:
+                existing_by_user_week[key] = build_existing_pick_index(
+                    get_user_week_picks(user_id, week_id)
+                )
+            existing_picks = existing_by_user_week[key]
+        
+        errors, warnings = validate(
             player_name=pick.get('player_name', ''),
             team=pick.get('team', ''),
             game_id=pick.get('game_id', ''),
             odds=pick.get('odds'),
-            user_id=pick.get('user_id'),
-            week_id=pick.get('week_id'),
-            roster_df=roster_df,
-            schedule_df=schedule_df,
-            existing_picks=None  # Would need to fetch per user
+            user_id=user_id,
+            week_id=week_id,
+            existing_picks=existing_picks
         )
         
         if errors or warnings:
@@ -211,13 +399,9 @@ def format_validation_message(errors: List[str], warnings: List[str]) -> str:
     message_parts = []
     
     if errors:
-        message_parts.append("**❌ Errors:**")
-        for error in errors:
-            message_parts.append(f"  • {error}")
+        message_parts.append("**❌ Errors:**\n" + "\n".join(f"  • {error}" for error in errors))
     
     if warnings:
-        message_parts.append("**⚠️ Warnings:**")
-        for warning in warnings:
-            message_parts.append(f"  • {warning}")
+        message_parts.append("**⚠️ Warnings:**\n" + "\n".join(f"  • {warning}" for warning in warnings))
     
     return "\n".join(message_parts)
@@ -19,7 +19,7 @@ import backend.config as config
 from backend.utils.caching import cached, CacheTTL
 from backend.utils.error_handling import log_exception, APIError
 from backend.utils.observability import log_event
-from backend.utils.resilience import CircuitBreakerOpen, get_circuit_breaker, request_with_retry
+from backend.utils.resilience import CircuitBreakerOpen, get_circuit_breaker, get_rate_limiter, request_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +89,7 @@ class KalshiClient:
                 jitter=config.API_RETRY_JITTER,
                 retry_on_statuses=(429, 500, 502, 503, 504),
                 get_status=lambda resp: getattr(resp, "status_code", None),
+                rate_limiter=get_rate_limiter("kalshi", config.KALSHI_RATE_LIMIT),
             )
             duration_ms = int((time.perf_counter() - request_start) * 1000)
             response.raise_for_status()
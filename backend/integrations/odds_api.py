@@ -7,16 +7,21 @@ import requests
 import logging
 import os
 import time
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import backend.config as config
 from backend.utils.caching import cached, CacheTTL
 from backend.utils.error_handling import log_exception, APIError, handle_exception
 from backend.utils.observability import log_event
 from backend.utils.resilience import CircuitBreakerOpen, get_circuit_breaker, request_with_retry
+from backend.utils.team_utils import get_team_abbr
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Markets served by the sport-level /odds endpoint; player props (e.g.
+# player_anytime_td) are only available per event via /events/{id}/odds.
+_FEATURED_MARKETS = frozenset({"h2h", "spreads", "totals"})
+
 
 def get_odds_api_key() -> Optional[str]:
     """
@@ -26,6 +31,82 @@ def get_odds_api_key() -> Optional[str]:
     return os.getenv("ODDS_API_KEY") or None
 
 
+def _parse_game_odds(data: dict) -> Dict[str, float]:
+    """
+    Extract {player_name: price} for the configured market from one event's odds payload.
+    Uses the first bookmaker that lists outcomes for the market.
+    """
+    market = next(
+        (
+            m
+            for bm in data.get('bookmakers', [])
+            for m in bm.get('markets', [])
+            if m['key'] == config.ODDS_API_MARKET and m['outcomes']
+        ),
+        None,
+    )
+    return {o['description']: o['price'] for o in market['outcomes']} if market else {}
+
+
+def _markets_are_featured(markets: str) -> bool:
+    """Return True if every market in a comma-separated list is a featured market."""
+    keys = [m.strip() for m in markets.split(',') if m.strip()]
+    return bool(keys) and all(k in _FEATURED_MARKETS for k in keys)
+
+
+def _fetch_odds_batch(api_key: str, event_ids: List[str]) -> Optional[Dict[str, dict]]:
+    """
+    Fetch odds for several events in one request via the sport-level odds endpoint.
+
+    Only valid for featured markets (see _markets_are_featured); player props
+    are rejected by this endpoint.
+
+    Returns:
+        Dict mapping event_id to its odds payload, or None if the batched read
+        failed or was rejected, in which case callers should fall back to
+        per-event requests.
+    """
+    odds_url = (
+        f'{config.ODDS_API_BASE_URL}/sports/{config.ODDS_API_SPORT}/odds?apiKey={api_key}'
+        f'&regions={config.ODDS_API_REGIONS}&markets={config.ODDS_API_MARKET}'
+        f'&oddsFormat={config.ODDS_API_FORMAT}&eventIds={",".join(event_ids)}'
+    )
+    batch_start = time.perf_counter()
+    log_event("api.odds.batch.request", event_count=len(event_ids))
+    try:
+        breaker = get_circuit_breaker(
+            "odds_api",
+            config.API_BREAKER_FAILURE_THRESHOLD,
+            config.API_BREAKER_COOLDOWN_SECONDS,
+        )
+        r = request_with_retry(
+            lambda: requests.get(odds_url, timeout=30),
+            breaker=breaker,
+            retries=config.API_RETRY_RETRIES,
+            backoff_base=config.API_RETRY_BACKOFF_BASE,
+            backoff_factor=config.API_RETRY_BACKOFF_FACTOR,
+            jitter=config.API_RETRY_JITTER,
+            retry_on_statuses=(429, 500, 502, 503, 504),
+            get_status=lambda resp: getattr(resp, "status_code", None),
+        )
+        batch_duration = int((time.perf_counter() - batch_start) * 1000)
+        if r.status_code != 200:
+            log_event("api.odds.batch.response", status_code=r.status_code, duration_ms=batch_duration)
+            logger.debug(f"Batched odds request rejected (HTTP {r.status_code}); using per-event requests")
+            return None
+        events = r.json()
+        log_event("api.odds.batch.response", status_code=r.status_code, duration_ms=batch_duration, event_count=len(events))
+        return {event['id']: event for event in events}
+    except CircuitBreakerOpen:
+        log_event("api.odds.batch.error", error="circuit_open")
+        return None
+    except (requests.exceptions.RequestException, ValueError, KeyError, TypeError) as e:
+        batch_duration = int((time.perf_counter() - batch_start) * 1000)
+        log_event("api.odds.batch.error", error=type(e).__name__, duration_ms=batch_duration)
+        log_exception(e, "odds_api_batch_error", {"event_count": len(event_ids)}, severity="warning")
+        return None
+
+
 @cached(ttl=CacheTTL.ODDS_API, cache_name="odds_api")
 def get_first_td_odds(api_key: str, week_start_date: str, week_end_date: str) -> Dict[Tuple[str, str], Dict[str, float]]:
     """
@@ -45,8 +126,6 @@ def get_first_td_odds(api_key: str, week_start_date: str, week_end_date: str) ->
         logger.warning("ODDS_API_KEY not available; skipping odds fetch")
         return {}
     
-    from backend.utils.team_utils import get_team_abbr
-    
     # 1. Get Events
     events_url = f'{config.ODDS_API_BASE_URL}/sports/{config.ODDS_API_SPORT}/events?apiKey={api_key}'
     try:
@@ -100,23 +179,38 @@ def get_first_td_odds(api_key: str, week_start_date: str, week_end_date: str) ->
         return {}
 
     # Filter events for the relevant week
-    # We rely on 'commence_time' (ISO format).
-    # Simple string comparison might be enough if dates are YYYY-MM-DD
-    week_events = []
-    
-    # week_start_date and week_end_date expect 'YYYY-MM-DD' strings
-    for e in events:
-        c_time = e['commence_time']  # e.g. 2024-09-08T17:00:00Z
-        c_date = c_time.split('T')[0]
-        if week_start_date <= c_date <= week_end_date:
-            week_events.append(e)
+    # We rely on 'commence_time' (ISO format, e.g. 2024-09-08T17:00:00Z);
+    # its first 10 chars compare directly against the 'YYYY-MM-DD' bounds.
+    week_events = [e for e in events if week_start_date <= e['commence_time'][:10] <= week_end_date]
 
     logger.info(f"Found {len(week_events)} games for week {week_start_date} to {week_end_date}")
     odds_data = {}
-    
-    for e in week_events:
+
+    # 2. Get Odds, batching several events per request when the configured
+    # markets are all featured markets; player props go straight to per-event requests
+    batch_size = max(1, int(config.ODDS_API_BATCH_SIZE))
+    if _markets_are_featured(config.ODDS_API_MARKET):
+        remaining_events = []
+        batch_starts = range(0, len(week_events), batch_size)
+    else:
+        remaining_events = list(week_events)
+        batch_starts = range(0)
+    for i in batch_starts:
+        chunk = week_events[i:i + batch_size]
+        batch = _fetch_odds_batch(api_key, [e['id'] for e in chunk])
+        if batch is None:
+            remaining_events.extend(week_events[i:])
+            break
+        for e in chunk:
+            data = batch.get(e['id'])
+            if data is None:
+                remaining_events.append(e)
+                continue
+            odds_data[(get_team_abbr(e['home_team']), get_team_abbr(e['away_team']))] = _parse_game_odds(data)
+
+    # Per-event fallback for anything the batched endpoint did not return
+    for e in remaining_events:
         event_id = e['id']
-        # 2. Get Odds for event
         # Use market from backend.config
         odds_url = f'{config.ODDS_API_BASE_URL}/sports/{config.ODDS_API_SPORT}/events/{event_id}/odds?apiKey={api_key}&regions={config.ODDS_API_REGIONS}&markets={config.ODDS_API_MARKET}&oddsFormat={config.ODDS_API_FORMAT}'
         
@@ -141,22 +235,7 @@ def get_first_td_odds(api_key: str, week_start_date: str, week_end_date: str) ->
             odds_duration = int((time.perf_counter() - odds_start) * 1000)
             if r_odds.status_code == 200:
                 data = r_odds.json()
-                # Parse bookmakers
-                # We'll take the first avail bookmaker for now
-                bookmakers = data.get('bookmakers', [])
-                game_odds = {}
-                if bookmakers:
-                    # Look for configured market
-                    for bm in bookmakers:
-                        for m in bm.get('markets', []):
-                            if m['key'] == config.ODDS_API_MARKET:
-                                for outcome in m['outcomes']:
-                                    p_name = outcome['description']
-                                    price = outcome['price']
-                                    game_odds[p_name] = price
-                                break  # Use first valid bookmaker
-                        if game_odds:
-                            break
+                game_odds = _parse_game_odds(data)
                 
                 # Map to team abbreviations for matching with schedule
                 h_team = get_team_abbr(e['home_team'])
@@ -14,25 +14,130 @@ Public endpoints don't require authentication.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import json
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from dateutil.tz import tzlocal
 
 import backend.config as config
-from backend.utils.caching import cached, CacheTTL
+from backend.utils.caching import cached, disk_cached, CacheTTL
 from backend.utils.error_handling import log_exception, APIError
 from backend.utils.observability import log_event
-from backend.utils.resilience import CircuitBreakerOpen, get_circuit_breaker, request_with_retry
+from backend.utils.resilience import CircuitBreakerOpen, get_circuit_breaker, get_rate_limiter, request_with_retry
+from backend.utils.team_utils import find_matchup_teams, find_team_abbrs
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Upper bound on concurrent slug lookups per call
+_SLUG_FETCH_WORKERS = 10
+
+# Lowercase phrases identifying a first-TD (or anytime TD) market question
+_FIRST_TD_KWS = (
+    'first touchdown', 'first td', '1st td', '1st touchdown', 'first to score',
+    'anytime td', 'anytime touchdown',
+)
+
+# One broad text search, paged, then filtered client-side with _FIRST_TD_KWS
+_FIRST_TD_SEARCH_QUERY = "NFL first"
+_SEARCH_PAGE_SIZE = 500
+_SEARCH_MAX_PAGES = 10
+
+# Player name -> slug segment: spaces become hyphens, periods and apostrophes drop
+_PLAYER_SLUG_TRANS = str.maketrans({' ': '-', '.': None, "'": None})
+
+# Slug lookup cache: misses (players without markets) expire sooner than hits
+_SLUG_NEGATIVE_TTL = 60
+_SLUG_CACHE_MAXSIZE = 4096
+_MISSING = object()
+_NOT_FOUND = object()
+
+# Keep-alive pool sized well above _SLUG_FETCH_WORKERS so fan-out reuses connections
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp from the Gamma API, or None if malformed.
+
+    Memoized because the same endDate strings recur across markets and
+    refreshes. Python 3.11's fromisoformat accepts the trailing 'Z' directly.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=16384)
+def _decode_str_list(value: str) -> Tuple:
+    """
+    Decode a stringified JSON array such as outcomePrices, or () if malformed.
+
+    Memoized on the raw string since the same markets reappear across
+    refreshes; returns a tuple so cached values can't be mutated by callers.
+    """
+    try:
+        decoded = _json_loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return ()
+    return tuple(decoded) if isinstance(decoded, list) else ()
+
+
+def _market_list_field(market: Dict, key: str) -> Tuple:
+    """Read a market array field that the Gamma API may return stringified."""
+    value = market.get(key) or ()
+    return _decode_str_list(value) if isinstance(value, str) else tuple(value)
+
 
-@dataclass
+def _stream_price_history(response: requests.Response) -> List[Dict]:
+    """
+    Incrementally parse a prices-history body, keeping only the {t, p} points.
+
+    Avoids holding the raw body and the fully decoded document in memory at
+    once for long lookbacks. Only used when ijson is installed.
+    """
+    response.raw.decode_content = True
+    try:
+        return [
+            {'t': item.get('t'), 'p': item.get('p')}
+            for item in ijson.items(response.raw, 'history.item', use_float=True)
+        ]
+    except ijson.JSONError as e:
+        raise ValueError(f"Malformed price history: {e}") from e
+    finally:
+        response.close()
+
+
+@dataclass(slots=True, frozen=True)
 class PolymarketMarket:
-    """Represents a Polymarket market."""
+    """Represents a Polymarket market (immutable; many are built per scan)."""
     condition_id: str
     question: str
     slug: str
@@ -46,6 +151,7 @@ class PolymarketMarket:
     event_slug: Optional[str] = None
 
 
+@lru_cache(maxsize=8192)
 def build_market_slug(
     away_team: str,
     home_team: str,
@@ -70,7 +176,7 @@ def build_market_slug(
         Market slug string
     """
     # Normalize player name: lowercase, replace spaces with hyphens
-    player_slug = player_name.lower().replace(' ', '-').replace('.', '').replace("'", '')
+    player_slug = player_name.lower().translate(_PLAYER_SLUG_TRANS)
 
     # Build slug
     slug = f"nfl-{away_team.lower()}-{home_team.lower()}-{game_date}-{prop_type}-{player_slug}"
@@ -87,43 +193,93 @@ class PolymarketClient:
 
     def __init__(self, cache_ttl: int = 3600):
         self.cache_ttl = cache_ttl
+        # slug -> (stored_at, market or None), in LRU order
+        self._slug_cache: "OrderedDict[str, Tuple[float, Optional[Dict]]]" = OrderedDict()
+        self._slug_cache_lock = threading.Lock()
+        # Resolved once; every client shares the registry's "polymarket" breaker
+        self._breaker = get_circuit_breaker(
+            "polymarket",
+            config.API_BREAKER_FAILURE_THRESHOLD,
+            config.API_BREAKER_COOLDOWN_SECONDS,
+        )
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            pool_block=False,
+        )
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'Accept': 'application/json',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         })
 
     def _make_request(
         self,
         base_url: str,
         endpoint: str,
-        params: Optional[Dict] = None,
-        timeout: int = 30
-    ) -> Optional[Dict]:
-        """Make a GET request to Polymarket APIs."""
+        params: Optional[Union[Dict, List[Tuple[str, object]]]] = None,
+        timeout: int = 30,
+        deadline: Optional[float] = None,
+        stream: bool = False,
+        parse: Optional[Callable[[requests.Response], Any]] = None,
+        not_found: Any = None
+    ) -> Optional[Any]:
+        """
+        Make a GET request to Polymarket APIs.
+
+        ``deadline`` (a time.monotonic() value) bounds the whole call including
+        retries; it defaults to POLYMARKET_REQUEST_BUDGET_SECONDS from now.
+        Pass a shared deadline to budget several requests as one operation.
+
+        ``parse`` replaces the default full JSON decode of the body; combine it
+        with ``stream=True`` to consume large bodies incrementally. It should
+        raise ValueError on malformed input.
+
+        Every failure returns None except a 404, which returns ``not_found``
+        so callers can tell a missing resource from a transient error.
+        """
         url = f"{base_url}/{endpoint}" if endpoint else base_url
+        if deadline is None:
+            deadline = time.monotonic() + config.POLYMARKET_REQUEST_BUDGET_SECONDS
+        elif time.monotonic() >= deadline:
+            log_event("api.polymarket.error", endpoint=endpoint or "root", error="deadline_exceeded")
+            return None
+        response = None
         try:
             request_start = time.perf_counter()
             log_event("api.polymarket.request", endpoint=endpoint or "root")
-            breaker = get_circuit_breaker(
-                "polymarket",
-                config.API_BREAKER_FAILURE_THRESHOLD,
-                config.API_BREAKER_COOLDOWN_SECONDS,
-            )
             response = request_with_retry(
-                lambda: self.session.get(url, params=params, timeout=timeout),
-                breaker=breaker,
+                # Never let a single attempt outlive the remaining budget
+                lambda: self.session.get(
+                    url,
+                    params=params,
+                    timeout=max(1, min(timeout, deadline - time.monotonic())),
+                    stream=stream,
+                ),
+                breaker=self._breaker,
                 retries=config.API_RETRY_RETRIES,
                 backoff_base=config.API_RETRY_BACKOFF_BASE,
                 backoff_factor=config.API_RETRY_BACKOFF_FACTOR,
                 jitter=config.API_RETRY_JITTER,
                 retry_on_statuses=(429, 500, 502, 503, 504),
                 get_status=lambda resp: getattr(resp, "status_code", None),
+                backoff_cap=config.API_RETRY_BACKOFF_CAP,
+                full_jitter=True,
+                deadline=deadline,
+                # gamma/clob/data are separate hosts with separate limits
+                rate_limiter=get_rate_limiter(f"polymarket:{base_url}", config.POLYMARKET_RATE_LIMIT),
+                # Retried streamed responses are never read; release their connections
+                discard=lambda resp: resp.close(),
             )
             duration_ms = int((time.perf_counter() - request_start) * 1000)
             response.raise_for_status()
             log_event("api.polymarket.response", endpoint=endpoint or "root", status_code=response.status_code, duration_ms=duration_ms)
-            return response.json()
+            if parse is not None:
+                return parse(response)
+            # Decode the raw bytes directly (orjson when available)
+            return _json_loads(response.content)
         except CircuitBreakerOpen:
             log_event("api.polymarket.error", endpoint=endpoint or "root", error="circuit_open")
             return None
@@ -140,7 +296,7 @@ class PolymarketClient:
             else:
                 logger.error(f"HTTP error fetching {url}: {e}")
             log_event("api.polymarket.response", endpoint=endpoint or "root", status_code=response.status_code, duration_ms=duration_ms)
-            return None
+            return not_found if response.status_code == 404 else None
         except requests.exceptions.RequestException as e:
             duration_ms = int((time.perf_counter() - request_start) * 1000)
             log_event("api.polymarket.error", endpoint=endpoint or "root", error=type(e).__name__, duration_ms=duration_ms)
@@ -151,6 +307,11 @@ class PolymarketClient:
             log_event("api.polymarket.error", endpoint=endpoint or "root", error=type(e).__name__, duration_ms=duration_ms)
             logger.error(f"JSON decode error for {url}: {e}")
             return None
+        finally:
+            # A streamed body may be left unread (HTTP error, parse failure);
+            # closing returns its connection to the pool
+            if stream and response is not None:
+                response.close()
 
     def get_market_by_slug(self, slug: str) -> Optional[Dict]:
         """
@@ -165,9 +326,86 @@ class PolymarketClient:
         Returns:
             Market data dict with clobTokenIds, or None if not found
         """
-        data = self._make_request(self.GAMMA_BASE_URL, f'markets/slug/{slug}')
+        cached_market = self._get_cached_slug(slug)
+        if cached_market is not _MISSING:
+            return cached_market
+
+        data = self._make_request(self.GAMMA_BASE_URL, f'markets/slug/{slug}', not_found=_NOT_FOUND)
+        if data is _NOT_FOUND:
+            self._cache_slug(slug, None)
+            return None
+        # Timeouts, 5xx and decode errors are transient: don't cache them as misses
+        if data is not None:
+            self._cache_slug(slug, data)
         return data
 
+    def _get_cached_slug(self, slug: str):
+        """Return the cached market (or None for a cached miss), or _MISSING if absent/expired."""
+        with self._slug_cache_lock:
+            entry = self._slug_cache.get(slug)
+            if entry is None:
+                return _MISSING
+            stored_at, market = entry
+            ttl = self.cache_ttl if market is not None else _SLUG_NEGATIVE_TTL
+            if time.monotonic() - stored_at >= ttl:
+                del self._slug_cache[slug]
+                return _MISSING
+            self._slug_cache.move_to_end(slug)
+            return market
+
+    def _cache_slug(self, slug: str, market: Optional[Dict]) -> None:
+        """Store a slug lookup result, evicting the least recently used entry when full."""
+        with self._slug_cache_lock:
+            self._slug_cache[slug] = (time.monotonic(), market)
+            self._slug_cache.move_to_end(slug)
+            if len(self._slug_cache) > _SLUG_CACHE_MAXSIZE:
+                self._slug_cache.popitem(last=False)
+
+    def get_markets_by_slugs(self, slugs: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        Get several markets in one request.
+
+        Gamma's markets endpoint accepts a repeated ``slug`` query parameter,
+        so a whole card of players costs a single round trip.
+
+        Args:
+            slugs: Market slugs to look up
+
+        Returns:
+            Dict mapping slug to market data (missing slugs are absent),
+            or None if the request failed or the slug filter was ignored
+        """
+        found = {}
+        pending = []
+        for slug in slugs:
+            cached_market = self._get_cached_slug(slug)
+            if cached_market is _MISSING:
+                pending.append(slug)
+            elif cached_market is not None:
+                found[slug] = cached_market
+        if not pending:
+            return found
+
+        params = [('slug', slug) for slug in pending]
+        params.append(('limit', len(pending)))
+        data = self._make_request(self.GAMMA_BASE_URL, 'markets', params)
+        if not isinstance(data, list):
+            return None
+
+        requested = set(pending)
+        # Markets we never asked for mean the filter wasn't applied, so the
+        # response says nothing about which slugs exist
+        if any(m.get('slug') and m['slug'] not in requested for m in data):
+            return None
+
+        # The filter held: every requested slug absent from the response
+        # (including all of them, for an empty list) is a genuine miss
+        fetched = {m['slug']: m for m in data if m.get('slug')}
+        for slug in pending:
+            self._cache_slug(slug, fetched.get(slug))
+        found.update(fetched)
+        return found
+
     def get_sports_tags(self) -> List[Dict]:
         """Get available sports tags and metadata."""
         data = self._make_request(self.GAMMA_BASE_URL, 'sports')
@@ -239,10 +477,18 @@ class PolymarketClient:
         data = self._make_request(self.GAMMA_BASE_URL, 'events', params)
         return data if isinstance(data, list) else []
 
-    def search_text(self, query: str, limit: int = 50) -> List[Dict]:
+    def search_text(
+        self,
+        query: str,
+        limit: int = 50,
+        offset: int = 0,
+        deadline: Optional[float] = None
+    ) -> List[Dict]:
         """Search markets by text query."""
         params = {'_q': query, '_limit': limit}
-        data = self._make_request(self.GAMMA_BASE_URL, 'markets', params)
+        if offset:
+            params['_offset'] = offset
+        data = self._make_request(self.GAMMA_BASE_URL, 'markets', params, deadline=deadline)
         return data if isinstance(data, list) else []
 
     def get_price_history(
@@ -278,9 +524,15 @@ class PolymarketClient:
         if end_ts:
             params['endTs'] = end_ts
 
-        data = self._make_request(self.CLOB_BASE_URL, 'prices-history', params)
-
         # Response format: {"history": [{"t": timestamp, "p": price}, ...]}
+        if HAS_IJSON:
+            history = self._make_request(
+                self.CLOB_BASE_URL, 'prices-history', params,
+                stream=True, parse=_stream_price_history,
+            )
+            return history or []
+
+        data = self._make_request(self.CLOB_BASE_URL, 'prices-history', params)
         if data and isinstance(data, dict):
             return data.get('history', [])
         return []
@@ -292,79 +544,27 @@ class PolymarketClient:
         """
         Search for NFL First TD markets.
 
-        Searches using keywords since Polymarket may not have a specific
-        NFL sports tag.
+        Searches text since Polymarket may not have a specific NFL sports
+        tag. One broad query is paged through and filtered client-side, rather
+        than one query per keyword returning largely the same markets.
         """
         markets = []
-        keywords = config.POLYMARKET_KEYWORDS
 
-        # Search for each keyword
+        # Pages share one time budget; conditionId dedupe guards against
+        # markets shifting between pages while paging
         seen_conditions = set()
-
-        for keyword in keywords:
-            results = self.search_text(f"NFL {keyword}", limit=100)
-
-            for m in results:
-                condition_id = m.get('conditionId', '')
-                if not condition_id or condition_id in seen_conditions:
-                    continue
-                seen_conditions.add(condition_id)
-
-                # Check if it's related to first TD
-                question = (m.get('question') or '').lower()
-                is_first_td = any(
-                    kw.lower() in question
-                    for kw in ['first touchdown', 'first td', '1st td', 'first to score']
-                )
-
-                if not is_first_td:
-                    continue
-
-                # Parse outcome prices (usually stringified JSON)
-                outcome_prices = m.get('outcomePrices', [])
-                if isinstance(outcome_prices, str):
-                    try:
-                        outcome_prices = json.loads(outcome_prices)
-                    except (json.JSONDecodeError, TypeError):
-                        outcome_prices = []
-
-                # Parse token IDs
-                token_ids = m.get('clobTokenIds', [])
-                if isinstance(token_ids, str):
-                    try:
-                        token_ids = json.loads(token_ids)
-                    except (json.JSONDecodeError, TypeError):
-                        token_ids = []
-
-                # Parse end date
-                end_date = None
-                end_date_str = m.get('endDate') or m.get('endDateIso')
-                if end_date_str:
-                    try:
-                        end_date = datetime.fromisoformat(
-                            end_date_str.replace('Z', '+00:00')
-                        )
-                    except (ValueError, TypeError):
-                        pass
-
-                # Get tags
-                tags = []
-                if m.get('tags'):
-                    tags = [t.get('label', '') for t in m.get('tags', []) if t.get('label')]
-
-                markets.append(PolymarketMarket(
-                    condition_id=condition_id,
-                    question=m.get('question', ''),
-                    slug=m.get('slug', ''),
-                    outcome_prices=[float(p) for p in outcome_prices] if outcome_prices else [],
-                    token_ids=token_ids,
-                    volume=float(m.get('volume', 0) or 0),
-                    end_date=end_date,
-                    active=m.get('active', False),
-                    closed=m.get('closed', False),
-                    tags=tags,
-                    event_slug=m.get('eventSlug')
-                ))
+        deadline = time.monotonic() + config.POLYMARKET_REQUEST_BUDGET_SECONDS
+
+        for page in range(_SEARCH_MAX_PAGES):
+            results = self.search_text(
+                _FIRST_TD_SEARCH_QUERY,
+                limit=_SEARCH_PAGE_SIZE,
+                offset=page * _SEARCH_PAGE_SIZE,
+                deadline=deadline,
+            )
+            markets.extend(self._first_td_markets(results, seen_conditions))
+            if len(results) < _SEARCH_PAGE_SIZE:
+                break
 
         if not include_closed:
             markets = [m for m in markets if not m.closed]
@@ -372,6 +572,65 @@ class PolymarketClient:
         logger.info(f"Found {len(markets)} NFL first TD markets on Polymarket")
         return markets
 
+    @staticmethod
+    def _first_td_markets(results: List[dict], seen_conditions: set) -> List[PolymarketMarket]:
+        """Parse first-TD markets from raw search results, skipping conditionIds already seen."""
+        markets = []
+        for m in results:
+            condition_id = m.get('conditionId', '')
+            if not condition_id or condition_id in seen_conditions:
+                continue
+            seen_conditions.add(condition_id)
+
+            # Check if it's related to first TD
+            question = (m.get('question') or '').lower()
+            if not any(kw in question for kw in _FIRST_TD_KWS):
+                continue
+
+            # Parse outcome prices and token IDs (usually stringified JSON)
+            outcome_prices = _market_list_field(m, 'outcomePrices')
+            token_ids = _market_list_field(m, 'clobTokenIds')
+
+            # Parse end date
+            end_date_str = m.get('endDate') or m.get('endDateIso')
+            end_date = _parse_iso(end_date_str) if end_date_str else None
+
+            # Get tags
+            tags = []
+            if m.get('tags'):
+                tags = [t.get('label', '') for t in m.get('tags', []) if t.get('label')]
+
+            markets.append(PolymarketMarket(
+                condition_id=condition_id,
+                question=m.get('question', ''),
+                slug=m.get('slug', ''),
+                outcome_prices=[float(p) for p in outcome_prices] if outcome_prices else [],
+                token_ids=list(token_ids),
+                volume=float(m.get('volume', 0) or 0),
+                end_date=end_date,
+                active=m.get('active', False),
+                closed=m.get('closed', False),
+                tags=tags,
+                event_slug=m.get('eventSlug')
+            ))
+        return markets
+
+
+_CLIENT: Optional[PolymarketClient] = None
+
+
+def get_polymarket_client() -> PolymarketClient:
+    """
+    Return the shared module-level client.
+
+    Reusing one client keeps its session's connection pool warm across calls
+    instead of paying a fresh TLS handshake per request.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = PolymarketClient(cache_ttl=config.POLYMARKET_CACHE_TTL)
+    return _CLIENT
+
 
 def probability_to_american_odds(prob: float) -> int:
     """Convert implied probability to American odds."""
@@ -383,6 +642,27 @@ def probability_to_american_odds(prob: float) -> int:
         return int(100 * (1 - prob) / prob)
 
 
+def _american_odds_vec(probs: np.ndarray) -> np.ndarray:
+    """Vectorized probability_to_american_odds (same truncation, 0 outside (0, 1))."""
+    probs = np.asarray(probs, dtype=np.float64)
+    out = np.zeros(probs.shape, dtype=np.int64)
+    valid = (probs > 0) & (probs < 1)
+    hi = valid & (probs >= 0.5)
+    lo = valid & (probs < 0.5)
+    out[hi] = (-100 * probs[hi] / (1 - probs[hi])).astype(np.int64)
+    out[lo] = (100 * (1 - probs[lo]) / probs[lo]).astype(np.int64)
+    return out
+
+
+def _fill_american_odds(entries: List[Dict]) -> None:
+    """Set 'american_odds' on odds entries from their implied probabilities in one batch."""
+    if not entries:
+        return
+    probs = np.fromiter((e['implied_probability'] for e in entries), dtype=np.float64, count=len(entries))
+    for entry, odds in zip(entries, _american_odds_vec(probs).tolist()):
+        entry['american_odds'] = odds
+
+
 def extract_player_from_question(question: str) -> Optional[str]:
     """
     Extract player name from Polymarket market question.
@@ -426,28 +706,25 @@ def extract_player_from_question(question: str) -> Optional[str]:
 
 def extract_teams_from_question(question: str) -> Tuple[Optional[str], Optional[str]]:
     """
-    Extract team names/abbreviations from market question.
-
-    Example: "...in Chiefs vs Bills game"
-    """
-    import re
+    Extract the two teams from a market question as abbreviations.
 
-    # Common patterns
-    vs_patterns = [
-        r'(\w+)\s+vs\.?\s+(\w+)',  # "Chiefs vs Bills"
-        r'(\w+)\s+@\s+(\w+)',       # "Chiefs @ Bills"
-        r'(\w+)\s+at\s+(\w+)',      # "Chiefs at Bills"
-    ]
-
-    for pattern in vs_patterns:
-        match = re.search(pattern, question, re.IGNORECASE)
-        if match:
-            return match.group(1), match.group(2)
+    Example: "...in Chiefs vs Bills game" -> ("KC", "BUF")
 
-    return None, None
+    The "X vs Y" matchup is resolved first so a player named like a city
+    doesn't count as a team; questions without one fall back to the first
+    two teams mentioned anywhere.
+    """
+    matchup = find_matchup_teams(question)
+    if matchup:
+        return matchup
+    teams = find_team_abbrs(question, limit=2)
+    if len(teams) < 2:
+        return None, None
+    return teams[0], teams[1]
 
 
 @cached(ttl=CacheTTL.POLYMARKET, cache_name="polymarket")
+@disk_cached(ttl=CacheTTL.POLYMARKET, cache_name="polymarket")
 def get_polymarket_first_td_odds(
     week_start_date: str,
     week_end_date: str
@@ -466,7 +743,7 @@ def get_polymarket_first_td_odds(
         logger.debug("Polymarket API disabled in config")
         return {}
 
-    client = PolymarketClient(cache_ttl=config.POLYMARKET_CACHE_TTL)
+    client = get_polymarket_client()
 
     # Search for NFL first TD markets
     markets = client.search_nfl_first_td_markets(include_closed=False)
@@ -476,10 +753,11 @@ def get_polymarket_first_td_odds(
         return {}
 
     # Filter by date range
-    start_date = datetime.strptime(week_start_date, '%Y-%m-%d')
-    end_date = datetime.strptime(week_end_date, '%Y-%m-%d') + timedelta(days=1)
+    start_date = datetime.fromisoformat(week_start_date)
+    end_date = datetime.fromisoformat(week_end_date) + timedelta(days=1)
 
     odds_data = {}
+    entries = []
 
     for market in markets:
         # Check if market is within date range
@@ -505,27 +783,69 @@ def get_polymarket_first_td_odds(
             yes_price = 0.5  # Default if no price available
 
         probability = yes_price  # Already a probability (0-1)
-        american_odds = probability_to_american_odds(probability)
 
-        game_key = (team1.upper(), team2.upper())
+        game_key = (team1, team2)
         if game_key not in odds_data:
             odds_data[game_key] = {}
 
-        odds_data[game_key][player_name] = {
+        entry = {
             'price': yes_price,
             'implied_probability': probability,
-            'american_odds': american_odds,
+            'american_odds': 0,  # filled in one batch below
             'volume': market.volume,
             'condition_id': market.condition_id,
             'slug': market.slug,
             'active': market.active
         }
+        odds_data[game_key][player_name] = entry
+        entries.append(entry)
+
+    _fill_american_odds(entries)
 
     logger.info(f"Fetched Polymarket odds for {len(odds_data)} games")
     return odds_data
 
 
+def _history_to_records(history: List[Dict]) -> List[Dict]:
+    """
+    Convert raw price-history points to {timestamp, price} records.
+
+    Points missing a timestamp or price are dropped. Prices and epoch-second
+    timestamps are converted in vectorized passes rather than per point;
+    timestamps become naive local datetimes, as datetime.fromtimestamp gives.
+    Non-numeric timestamps are passed through unchanged.
+    """
+    points = [
+        (ts, price)
+        for ts, price in (
+            (h.get('t') or h.get('timestamp'), h.get('p') or h.get('price')) for h in history
+        )
+        if ts and price
+    ]
+    if not points:
+        return []
+
+    raw_ts, raw_prices = zip(*points)
+    prices = np.asarray(raw_prices, dtype=np.float64).tolist()
+
+    timestamps = list(raw_ts)
+    numeric_idx = [i for i, ts in enumerate(raw_ts) if isinstance(ts, (int, float))]
+    if numeric_idx:
+        seconds = np.asarray([raw_ts[i] for i in numeric_idx], dtype=np.float64)
+        local = (
+            pd.to_datetime(seconds, unit='s', utc=True)
+            .tz_convert(tzlocal())
+            .tz_localize(None)
+            .to_pydatetime()
+        )
+        for i, dt in zip(numeric_idx, local):
+            timestamps[i] = dt
+
+    return [{'timestamp': ts, 'price': price} for ts, price in zip(timestamps, prices)]
+
+
 @cached(ttl=CacheTTL.POLYMARKET, cache_name="polymarket")
+@disk_cached(ttl=CacheTTL.POLYMARKET, cache_name="polymarket")
 def get_polymarket_historical_odds(
     condition_id: str,
     token_id: str,
@@ -545,7 +865,7 @@ def get_polymarket_historical_odds(
     if not config.POLYMARKET_ENABLED:
         return []
 
-    client = PolymarketClient()
+    client = get_polymarket_client()
 
     start_ts = int((datetime.now() - timedelta(days=lookback_days)).timestamp())
     end_ts = int(datetime.now().timestamp())
@@ -553,19 +873,27 @@ def get_polymarket_historical_odds(
     history = client.get_price_history(token_id, start_ts=start_ts, end_ts=end_ts)
 
     # Convert to simpler format
-    result = []
-    for h in history:
-        timestamp = h.get('t') or h.get('timestamp')
-        price = h.get('p') or h.get('price')
-        if timestamp and price:
-            if isinstance(timestamp, (int, float)):
-                timestamp = datetime.fromtimestamp(timestamp)
-            result.append({
-                'timestamp': timestamp,
-                'price': float(price)
-            })
+    return _history_to_records(history)
+
 
-    return result
+def _fetch_markets_by_slug(client: PolymarketClient, slugs: List[str]) -> List[Optional[Dict]]:
+    """
+    Fetch markets for several slugs, returned in the same order as ``slugs``.
+
+    Tries a single batched markets query first. If that fails or the slug
+    filter is not honoured, falls back to per-slug lookups fanned out over a
+    small thread pool sharing the client's session.
+    """
+    if len(slugs) > 1:
+        by_slug = client.get_markets_by_slugs(slugs)
+        if by_slug is not None:
+            return [by_slug.get(slug) for slug in slugs]
+
+    if len(slugs) <= 1:
+        return [client.get_market_by_slug(slug) for slug in slugs]
+
+    with ThreadPoolExecutor(max_workers=min(_SLUG_FETCH_WORKERS, len(slugs))) as pool:
+        return list(pool.map(client.get_market_by_slug, slugs))
 
 
 def get_polymarket_odds_by_slug(
@@ -596,52 +924,44 @@ def get_polymarket_odds_by_slug(
     if not config.POLYMARKET_ENABLED:
         return {}
 
-    client = PolymarketClient()
+    client = get_polymarket_client()
     results = {}
 
-    for player_name in player_names:
-        slug = build_market_slug(away_team, home_team, game_date, player_name, prop_type)
-        market = client.get_market_by_slug(slug)
+    slugs = [
+        build_market_slug(away_team, home_team, game_date, player_name, prop_type)
+        for player_name in player_names
+    ]
+    markets = _fetch_markets_by_slug(client, slugs)
 
+    for player_name, slug, market in zip(player_names, slugs, markets):
         if not market:
             logger.debug(f"No Polymarket market found for slug: {slug}")
             continue
 
-        # Parse outcome prices
-        outcome_prices = market.get('outcomePrices', [])
-        if isinstance(outcome_prices, str):
-            try:
-                outcome_prices = json.loads(outcome_prices)
-            except (json.JSONDecodeError, TypeError):
-                outcome_prices = []
-
-        # Parse token IDs (needed for price history)
-        token_ids = market.get('clobTokenIds', [])
-        if isinstance(token_ids, str):
-            try:
-                token_ids = json.loads(token_ids)
-            except (json.JSONDecodeError, TypeError):
-                token_ids = []
+        # Parse outcome prices and token IDs (needed for price history)
+        outcome_prices = _market_list_field(market, 'outcomePrices')
+        token_ids = _market_list_field(market, 'clobTokenIds')
 
         # YES price is typically first element
         yes_price = float(outcome_prices[0]) if outcome_prices else 0
         probability = yes_price  # Already 0-1 scale
-        american_odds = probability_to_american_odds(probability)
 
         results[player_name] = {
             'price': yes_price,
             'implied_probability': probability,
-            'american_odds': american_odds,
+            'american_odds': 0,  # filled in one batch below
             'volume': float(market.get('volume', 0) or 0),
             'condition_id': market.get('conditionId', ''),
             'slug': slug,
-            'token_ids': token_ids,
+            'token_ids': list(token_ids),
             'active': market.get('active', False),
             'closed': market.get('closed', False)
         }
 
         logger.debug(f"Found Polymarket odds for {player_name}: {probability:.1%}")
 
+    _fill_american_odds(list(results.values()))
+
     logger.info(f"Fetched Polymarket odds for {len(results)}/{len(player_names)} players")
     return results
 
@@ -671,7 +991,7 @@ def get_polymarket_price_history_for_player(
     if not config.POLYMARKET_ENABLED:
         return []
 
-    client = PolymarketClient()
+    client = get_polymarket_client()
 
     # Build slug and fetch market
     slug = build_market_slug(away_team, home_team, game_date, player_name, prop_type)
@@ -682,12 +1002,7 @@ def get_polymarket_price_history_for_player(
         return []
 
     # Get token IDs
-    token_ids = market.get('clobTokenIds', [])
-    if isinstance(token_ids, str):
-        try:
-            token_ids = json.loads(token_ids)
-        except (json.JSONDecodeError, TypeError):
-            return []
+    token_ids = _market_list_field(market, 'clobTokenIds')
 
     if not token_ids:
         return []
@@ -702,14 +1017,4 @@ def get_polymarket_price_history_for_player(
     history = client.get_price_history(yes_token_id, start_ts=start_ts, end_ts=end_ts)
 
     # Convert to standard format
-    result = []
-    for h in history:
-        ts = h.get('t')
-        price = h.get('p')
-        if ts and price:
-            result.append({
-                'timestamp': datetime.fromtimestamp(ts) if isinstance(ts, (int, float)) else ts,
-                'price': float(price)
-            })
-
-    return result
+    return _history_to_records(history)
@@ -3,18 +3,26 @@ Unified Prediction Market Interface
 Aggregates data from Polymarket and Kalshi with a common interface.
 """
 
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+from datetime import date, datetime
 from dataclasses import dataclass
 
+import numpy as np
+
 import backend.config as config
-from .polymarket_api import (
+from backend.utils.caching import disk_cache_clear, disk_cache_get_with_age, disk_cache_set
+from .polymarket import (
     PolymarketClient,
     get_polymarket_first_td_odds,
     probability_to_american_odds as pm_prob_to_odds
 )
-from .kalshi_api import (
+from .kalshi import (
     KalshiClient,
     get_kalshi_first_td_odds,
     probability_to_american_odds as kalshi_prob_to_odds
@@ -22,10 +30,15 @@ from .kalshi_api import (
 
 logger = logging.getLogger(__name__)
 
+# Aggregated odds cache: live/upcoming weeks refresh quickly, finished weeks rarely change
+_ODDS_CACHE_TTL_LIVE = 300
+_ODDS_CACHE_TTL_PAST = 3600
+_ODDS_CACHE_MAXSIZE = 32
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketOddsRecord:
-    """Unified market odds record from any source."""
+    """Unified market odds record from any source (immutable; shared via the odds cache)."""
     source: str  # "polymarket" or "kalshi"
     player_name: str
     implied_probability: float
@@ -37,6 +50,13 @@ class MarketOddsRecord:
     team: Optional[str] = None
 
 
+def _copy_odds(
+    all_odds: Dict[Tuple[str, str], List[MarketOddsRecord]]
+) -> Dict[Tuple[str, str], List[MarketOddsRecord]]:
+    """Copy the game dict and its record lists; the frozen records themselves are shared."""
+    return {game: list(records) for game, records in all_odds.items()}
+
+
 class PredictionMarketAggregator:
     """Aggregates prediction market data from multiple sources."""
 
@@ -53,6 +73,26 @@ class PredictionMarketAggregator:
         if 'kalshi' in self.enabled_sources and config.KALSHI_ENABLED:
             self._kalshi_client = KalshiClient(api_key=config.KALSHI_API_KEY)
 
+        # (week_start, week_end, sources) -> (stored_at, odds), oldest first
+        self._odds_cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._odds_cache_lock = threading.RLock()
+        self._refreshing: set = set()
+
+    def invalidate(self, week_start_date: str, week_end_date: str) -> None:
+        """Drop cached odds for a week (all source combinations, in memory and on disk)."""
+        with self._odds_cache_lock:
+            for key in [k for k in self._odds_cache if k[:2] == (week_start_date, week_end_date)]:
+                del self._odds_cache[key]
+        disk_cache_clear(self._disk_cache_location((week_start_date, week_end_date, ()))[0])
+
+    @staticmethod
+    def _odds_cache_ttl(week_end_date: str) -> int:
+        try:
+            week_over = date.fromisoformat(week_end_date) < date.today()
+        except ValueError:
+            week_over = False
+        return _ODDS_CACHE_TTL_PAST if week_over else _ODDS_CACHE_TTL_LIVE
+
     def get_first_td_odds(
         self,
         week_start_date: str,
@@ -69,73 +109,180 @@ class PredictionMarketAggregator:
 
         Returns:
             Dict mapping (home_team, away_team) to list of MarketOddsRecord
+
+        Results are cached per (week, sources): 5 minutes for current weeks,
+        an hour once the week is over. The in-process cache sits on a disk
+        cache shared by worker processes, so one worker's fetch serves all of
+        them. For up to one more TTL past expiry the stale odds are returned
+        while a background thread refreshes them. Use invalidate() to force a
+        refresh. Each call gets its own dict and lists, so callers may mutate
+        the result without touching the cache (the records are immutable).
         """
         if sources is None:
             sources = self.enabled_sources
 
-        all_odds: Dict[Tuple[str, str], List[MarketOddsRecord]] = {}
-        now = datetime.utcnow()
+        cache_key = (week_start_date, week_end_date, tuple(sorted(sources)))
+        ttl = self._odds_cache_ttl(week_end_date)
+        with self._odds_cache_lock:
+            entry = self._odds_cache.get(cache_key)
+        if entry:
+            age = time.monotonic() - entry[0]
+            if age < ttl:
+                return _copy_odds(entry[1])
+            if age < 2 * ttl:
+                self._refresh_in_background(cache_key)
+                return _copy_odds(entry[1])
+
+        # Another worker may already have fetched this week
+        disk_name, disk_key = self._disk_cache_location(cache_key)
+        hit = disk_cache_get_with_age(disk_name, disk_key, ttl)
+        if hit is not None:
+            # Expire the in-memory copy with the file, not a fresh TTL from now
+            all_odds, age = hit
+        else:
+            all_odds, age = self._fetch_first_td_odds(week_start_date, week_end_date, sources), 0.0
+            disk_cache_set(disk_name, disk_key, all_odds)
 
-        # Fetch from Polymarket
-        if 'polymarket' in sources and config.POLYMARKET_ENABLED:
+        self._store_odds(cache_key, all_odds, age)
+        return _copy_odds(all_odds)
+
+    @staticmethod
+    def _disk_cache_location(cache_key: Tuple) -> Tuple[str, str]:
+        week_start_date, week_end_date, sources = cache_key
+        # One directory per week so invalidate() can drop every source combination
+        return f"first_td_odds/{week_start_date}_{week_end_date}", ",".join(sources)
+
+    def _store_odds(self, cache_key: Tuple, all_odds: Dict, age: float = 0.0) -> None:
+        # Don't cache a total miss (e.g. both sources down) so it can recover
+        if not all_odds:
+            return
+        with self._odds_cache_lock:
+            # Back-date by the data's age so a disk hit keeps only its remaining TTL
+            self._odds_cache[cache_key] = (time.monotonic() - age, all_odds)
+            self._odds_cache.move_to_end(cache_key)
+            while len(self._odds_cache) > _ODDS_CACHE_MAXSIZE:
+                self._odds_cache.popitem(last=False)
+
+    def _refresh_in_background(self, cache_key: Tuple) -> None:
+        """Refetch a stale week on a daemon thread, at most one refresh per key at a time."""
+        with self._odds_cache_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def refresh():
             try:
-                pm_odds = get_polymarket_first_td_odds(week_start_date, week_end_date)
-                for game_key, players in pm_odds.items():
-                    if game_key not in all_odds:
-                        all_odds[game_key] = []
-
-                    for player_name, odds_info in players.items():
-                        all_odds[game_key].append(MarketOddsRecord(
-                            source='polymarket',
-                            player_name=player_name,
-                            implied_probability=odds_info.get('implied_probability', 0),
-                            american_odds=odds_info.get('american_odds', 0),
-                            volume=odds_info.get('volume'),
-                            last_update=now,
-                            market_id=odds_info.get('condition_id', ''),
-                            raw_price=odds_info.get('price', 0)
-                        ))
+                week_start_date, week_end_date, sources = cache_key
+                all_odds = self._fetch_first_td_odds(week_start_date, week_end_date, list(sources))
+                disk_cache_set(*self._disk_cache_location(cache_key), all_odds)
+                self._store_odds(cache_key, all_odds)
             except Exception as e:
-                logger.error(f"Error fetching Polymarket odds: {e}")
+                logger.error(f"Background odds refresh failed for {cache_key}: {e}")
+            finally:
+                with self._odds_cache_lock:
+                    self._refreshing.discard(cache_key)
+
+        threading.Thread(target=refresh, name="odds-refresh", daemon=True).start()
+
+    async def get_first_td_odds_async(
+        self,
+        week_start_date: str,
+        week_end_date: str,
+        sources: Optional[List[str]] = None
+    ) -> Dict[Tuple[str, str], List[MarketOddsRecord]]:
+        """
+        Async variant of get_first_td_odds for event-loop callers (FastAPI routes).
+
+        This is a thread offload, not async I/O: the source clients are
+        blocking requests sessions, so the sync get_first_td_odds (cache and
+        thread-pooled source fetch included) runs in a worker thread. The
+        event loop stays free, but there is no extra I/O concurrency over
+        the sync path.
+        """
+        return await asyncio.to_thread(self.get_first_td_odds, week_start_date, week_end_date, sources)
+
+    def _fetch_first_td_odds(
+        self,
+        week_start_date: str,
+        week_end_date: str,
+        sources: List[str]
+    ) -> Dict[Tuple[str, str], List[MarketOddsRecord]]:
+        """Fetch and merge odds from the requested sources (uncached)."""
+        all_odds: Dict[Tuple[str, str], List[MarketOddsRecord]] = {}
+        now = datetime.utcnow()
 
-        # Fetch from Kalshi
+        # (source, display name, fetcher, market id field) for each enabled source
+        fetchers = []
+        if 'polymarket' in sources and config.POLYMARKET_ENABLED:
+            fetchers.append(('polymarket', 'Polymarket', get_polymarket_first_td_odds, 'condition_id'))
         if 'kalshi' in sources and config.KALSHI_ENABLED:
-            try:
-                kalshi_odds = get_kalshi_first_td_odds(week_start_date, week_end_date)
-                for game_key, players in kalshi_odds.items():
-                    if game_key not in all_odds:
-                        all_odds[game_key] = []
-
-                    for player_name, odds_info in players.items():
-                        all_odds[game_key].append(MarketOddsRecord(
-                            source='kalshi',
-                            player_name=player_name,
-                            implied_probability=odds_info.get('implied_probability', 0),
-                            american_odds=odds_info.get('american_odds', 0),
-                            volume=odds_info.get('volume'),
-                            last_update=now,
-                            market_id=odds_info.get('ticker', ''),
-                            raw_price=odds_info.get('price', 0)
-                        ))
-            except Exception as e:
-                logger.error(f"Error fetching Kalshi odds: {e}")
+            fetchers.append(('kalshi', 'Kalshi', get_kalshi_first_td_odds, 'ticker'))
+        if not fetchers:
+            return all_odds
+
+        # The sources are independent I/O-bound fetches, so run them concurrently;
+        # results are merged in source order to keep the output deterministic
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+            futures = [
+                (source, label, id_field, pool.submit(fetch, week_start_date, week_end_date))
+                for source, label, fetch, id_field in fetchers
+            ]
+
+            for source, label, id_field, future in futures:
+                try:
+                    source_odds = future.result()
+                    for game_key, players in source_odds.items():
+                        # One lookup per game; the plain dict (not defaultdict) is
+                        # cached and handed to callers, so .get() must not insert
+                        game_records = all_odds.setdefault(game_key, [])
+                        for player_name, odds_info in players.items():
+                            game_records.append(MarketOddsRecord(
+                                source=source,
+                                player_name=player_name,
+                                implied_probability=odds_info.get('implied_probability', 0),
+                                american_odds=odds_info.get('american_odds', 0),
+                                volume=odds_info.get('volume'),
+                                last_update=now,
+                                market_id=odds_info.get(id_field, ''),
+                                raw_price=odds_info.get('price', 0)
+                            ))
+                except Exception as e:
+                    logger.error(f"Error fetching {label} odds: {e}")
 
         return all_odds
 
+    def prefetch_week(
+        self,
+        week_start_date: str,
+        week_end_date: str
+    ) -> Dict[Tuple[str, str], List[MarketOddsRecord]]:
+        """
+        Load a week's odds from all enabled sources in one go.
+
+        Call this before looping over a week's games; each get_odds_for_game
+        call is then served from the week's cached odds (or pass the returned
+        dict as ``week_odds`` to skip even the cache lookup).
+        """
+        return self.get_first_td_odds(week_start_date, week_end_date)
+
     def get_odds_for_game(
         self,
         home_team: str,
         away_team: str,
         week_start_date: str,
-        week_end_date: str
+        week_end_date: str,
+        week_odds: Optional[Dict[Tuple[str, str], List[MarketOddsRecord]]] = None
     ) -> Dict[str, List[MarketOddsRecord]]:
         """
         Get odds for a specific game, grouped by player.
 
+        Args:
+            week_odds: Result of prefetch_week for this week, if already loaded
+
         Returns:
             {player_name: [MarketOddsRecord from each source]}
         """
-        all_odds = self.get_first_td_odds(week_start_date, week_end_date)
+        all_odds = week_odds if week_odds is not None else self.prefetch_week(week_start_date, week_end_date)
 
         # Try both orderings of teams
         game_key = (home_team, away_team)
@@ -146,9 +293,7 @@ class PredictionMarketAggregator:
         # Group by player
         by_player: Dict[str, List[MarketOddsRecord]] = {}
         for record in records:
-            if record.player_name not in by_player:
-                by_player[record.player_name] = []
-            by_player[record.player_name].append(record)
+            by_player.setdefault(record.player_name, []).append(record)
 
         return by_player
 
@@ -179,31 +324,46 @@ class PredictionMarketAggregator:
         """
         Find potential arbitrage opportunities where prices differ significantly.
 
+        Only the widest spread per player is actionable, so each player yields
+        at most one opportunity: the lowest- vs highest-priced source.
+
         Returns:
             List of {player, source1, source2, prob_diff, potential_edge}
         """
         opportunities = []
 
-        for player_name, records in odds_by_player.items():
-            if len(records) < 2:
-                continue
-
-            # Compare all pairs
-            for i, r1 in enumerate(records):
-                for r2 in records[i+1:]:
-                    prob_diff = abs(r1.implied_probability - r2.implied_probability)
-
-                    # Significant difference threshold (e.g., 5%)
-                    if prob_diff > 0.05:
-                        opportunities.append({
-                            'player': player_name,
-                            'source1': r1.source,
-                            'source2': r2.source,
-                            'prob1': r1.implied_probability,
-                            'prob2': r2.implied_probability,
-                            'prob_diff': prob_diff,
-                            'potential_edge': prob_diff * 100  # As percentage
-                        })
+        # Flatten every comparable player's prices into one array so the
+        # per-player min/max spread is computed by segment reductions
+        players = [(name, records) for name, records in odds_by_player.items() if len(records) >= 2]
+        if not players:
+            return opportunities
+
+        sizes = np.fromiter((len(records) for _, records in players), dtype=np.intp, count=len(players))
+        starts = np.zeros(len(players), dtype=np.intp)
+        np.cumsum(sizes[:-1], out=starts[1:])
+        probs = np.fromiter(
+            (r.implied_probability for _, records in players for r in records),
+            dtype=np.float64,
+            count=int(sizes.sum())
+        )
+        spreads = np.maximum.reduceat(probs, starts) - np.minimum.reduceat(probs, starts)
+
+        # Significant difference threshold (e.g., 5%)
+        for i in np.flatnonzero(spreads > 0.05):
+            player_name, records = players[i]
+            segment = probs[starts[i]:starts[i] + sizes[i]]
+            low = records[int(segment.argmin())]
+            high = records[int(segment.argmax())]
+            prob_diff = high.implied_probability - low.implied_probability
+            opportunities.append({
+                'player': player_name,
+                'source1': low.source,
+                'source2': high.source,
+                'prob1': low.implied_probability,
+                'prob2': high.implied_probability,
+                'prob_diff': prob_diff,
+                'potential_edge': prob_diff * 100  # As percentage
+            })
 
         return sorted(opportunities, key=lambda x: x['prob_diff'], reverse=True)
 
@@ -231,17 +391,17 @@ def link_odds_to_first_td_results(
         }
     """
     from backend.database.market_odds import (
-        get_market_odds_for_week,
-        add_market_outcome,
+        add_market_outcomes_batch,
         get_latest_odds_snapshot
     )
 
     try:
-        from backend.utils.name_matching import names_match
+        from backend.utils.name_matching import names_matcher
     except ImportError:
         # Fallback to simple matching
-        def names_match(name1: str, name2: str, threshold: float = 0.75) -> bool:
-            return name1.lower().strip() == name2.lower().strip()
+        def names_matcher(actual_name: str, threshold: float = 0.75):
+            actual = actual_name.lower().strip()
+            return lambda name: name.lower().strip() == actual
 
     # Try to get first TD data from the grading module
     try:
@@ -278,34 +438,34 @@ def link_odds_to_first_td_results(
             continue
 
         # Find the favorite (highest implied probability)
-        favorite_name = None
-        favorite_prob = 0
-
-        for player_name, odds_data in latest_odds.items():
-            if odds_data['implied_probability'] > favorite_prob:
-                favorite_prob = odds_data['implied_probability']
-                favorite_name = player_name
-
-        # Check each player's odds
+        favorite_name, favorite_odds = max(latest_odds.items(), key=lambda kv: kv[1]['implied_probability'])
+        if favorite_odds['implied_probability'] <= 0:
+            favorite_name = None
+
+        # Check each player's odds, writing the game's outcomes in one batch.
+        # The scorer's name is normalized once for the whole game.
+        matches_scorer = names_matcher(actual_scorer)
+        outcomes = []
         for player_name, odds_data in latest_odds.items():
-            is_match = names_match(player_name, actual_scorer)
+            is_match = matches_scorer(player_name)
 
-            add_market_outcome(
-                source=odds_data['source'],
-                game_id=game_id,
-                market_id=odds_data.get('market_id', ''),
-                player_name=player_name,
-                resolved_outcome='yes' if is_match else 'no',
-                actual_first_td_scorer=actual_scorer
-            )
-
-            stats['odds_linked'] += 1
+            outcomes.append({
+                'source': odds_data['source'],
+                'game_id': game_id,
+                'market_id': odds_data.get('market_id', ''),
+                'player_name': player_name,
+                'resolved_outcome': 'yes' if is_match else 'no',
+                'actual_first_td_scorer': actual_scorer
+            })
 
             if is_match:
                 stats['matches_found'] += 1
                 if player_name == favorite_name:
                     stats['favorites_correct'] += 1
 
+        add_market_outcomes_batch(outcomes)
+        stats['odds_linked'] += len(outcomes)
+
     if stats['games_processed'] > 0:
         stats['accuracy_rate'] = stats['favorites_correct'] / stats['games_processed']
     else:
@@ -324,26 +484,34 @@ def get_enabled_sources() -> List[str]:
     return sources
 
 
-def test_connections() -> Dict[str, bool]:
-    """Test connections to all enabled prediction market APIs."""
-    results = {}
+def _probe_polymarket() -> bool:
+    try:
+        return len(PolymarketClient().get_all_tags()) > 0
+    except Exception as e:
+        logger.error(f"Polymarket connection test failed: {e}")
+        return False
 
-    if config.POLYMARKET_ENABLED:
-        try:
-            client = PolymarketClient()
-            tags = client.get_all_tags()
-            results['polymarket'] = len(tags) > 0
-        except Exception as e:
-            logger.error(f"Polymarket connection test failed: {e}")
-            results['polymarket'] = False
 
+def _probe_kalshi() -> bool:
+    try:
+        markets, _ = KalshiClient().get_markets(limit=1)
+        return len(markets) > 0
+    except Exception as e:
+        logger.error(f"Kalshi connection test failed: {e}")
+        return False
+
+
+def test_connections() -> Dict[str, bool]:
+    """Test connections to all enabled prediction market APIs (probed concurrently)."""
+    probes = []
+    if config.POLYMARKET_ENABLED:
+        probes.append(('polymarket', _probe_polymarket))
     if config.KALSHI_ENABLED:
-        try:
-            client = KalshiClient()
-            markets, _ = client.get_markets(limit=1)
-            results['kalshi'] = len(markets) > 0
-        except Exception as e:
-            logger.error(f"Kalshi connection test failed: {e}")
-            results['kalshi'] = False
-
-    return results
+        probes.append(('kalshi', _probe_kalshi))
+    if not probes:
+        return {}
+
+    # Each probe catches its own errors, so one source failing never affects the other
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = [(source, pool.submit(probe)) for source, probe in probes]
+        return {source: future.result() for source, future in futures}
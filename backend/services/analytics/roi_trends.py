@@ -70,11 +70,9 @@ def get_user_roi_trend(user_id: int, season: int) -> pd.DataFrame:
                 df[col] = df[col].apply(lambda x: int.from_bytes(x, byteorder='little') if isinstance(x, bytes) else x)
         
         # Ensure all numeric columns are proper types
-        df['week'] = pd.to_numeric(df['week'], errors='coerce').fillna(0).astype(int)
+        count_cols = ['week', 'picks_count', 'wins', 'losses']
+        df[count_cols] = df[count_cols].apply(pd.to_numeric, errors='coerce').fillna(0).astype(int)
         df['week_profit'] = pd.to_numeric(df['week_profit'], errors='coerce').fillna(0.0).astype(float)
-        df['picks_count'] = pd.to_numeric(df['picks_count'], errors='coerce').fillna(0).astype(int)
-        df['wins'] = pd.to_numeric(df['wins'], errors='coerce').fillna(0).astype(int)
-        df['losses'] = pd.to_numeric(df['losses'], errors='coerce').fillna(0).astype(int)
         
         # Calculate cumulative ROI
         df['cumulative_profit'] = df['week_profit'].cumsum()
@@ -132,10 +130,9 @@ def get_weekly_roi_all_users(season: int) -> pd.DataFrame:
         
         # Ensure all columns are proper types
         df['user_name'] = df['user_name'].astype(str)
-        df['week'] = pd.to_numeric(df['week'], errors='coerce').fillna(0).astype(int)
+        count_cols = ['week', 'picks_count', 'wins']
+        df[count_cols] = df[count_cols].apply(pd.to_numeric, errors='coerce').fillna(0).astype(int)
         df['week_profit'] = pd.to_numeric(df['week_profit'], errors='coerce').fillna(0.0).astype(float)
-        df['picks_count'] = pd.to_numeric(df['picks_count'], errors='coerce').fillna(0).astype(int)
-        df['wins'] = pd.to_numeric(df['wins'], errors='coerce').fillna(0).astype(int)
         
         # Calculate ROI per week
         df['week_roi'] = (df['week_profit'] / df['picks_count']) * 100
@@ -85,6 +85,9 @@ def sync_rosters(season: int) -> Dict[str, int]:
         conn.commit()
         conn.close()
         
+        from backend.utils.caching import invalidate_on_roster_sync
+        invalidate_on_roster_sync()
+        
         logger.info(f"Roster sync complete: {stats}")
         return stats
     
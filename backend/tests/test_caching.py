@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from backend.utils.caching import cached, disk_cached, invalidate_on_roster_sync
+
+
+class TestDiskCached(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = patch('backend.utils.caching.config.CACHE_DIR', self._tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = []
+
+    def _fetch(self, ttl=60):
+        @disk_cached(ttl=ttl, cache_name="test")
+        def fetch(week_start, week_end):
+            self.calls.append((week_start, week_end))
+            return self.result
+        return fetch
+
+    def test_result_persists_across_decorations(self):
+        self.result = {('KC', 'BUF'): {'Travis Kelce': 0.2}}
+        self.assertEqual(self._fetch()('2025-09-04', '2025-09-08'), self.result)
+        # A fresh wrapper (e.g. another process) reads the file instead of calling through
+        self.assertEqual(self._fetch()('2025-09-04', '2025-09-08'), self.result)
+        self.assertEqual(len(self.calls), 1)
+
+        self._fetch()('2025-09-11', '2025-09-15')
+        self.assertEqual(len(self.calls), 2)
+
+    def test_expired_and_empty_results_are_refetched(self):
+        self.result = {}
+        self._fetch()('a', 'b')
+        self._fetch()('a', 'b')
+        self.assertEqual(len(self.calls), 2)
+
+        self.result = {'x': 1}
+        self._fetch(ttl=0)('a', 'b')
+        self._fetch(ttl=0)('a', 'b')
+        self.assertEqual(len(self.calls), 4)
+
+    def test_disabled_by_env(self):
+        self.result = {'x': 1}
+        with patch.dict(os.environ, {'FAST6_DISABLE_CACHING': '1'}):
+            self._fetch()('a', 'b')
+            self._fetch()('a', 'b')
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(os.listdir(self._tmp.name), [])
+
+
+class TestRosterCacheInvalidation(unittest.TestCase):
+    def test_roster_sync_clears_roster_cache(self):
+        calls = []
+
+        @cached(ttl=3600, cache_name="nfl_rosters")
+        def load(season):
+            calls.append(season)
+            return season
+
+        load(2025)
+        load(2025)
+        self.assertEqual(calls, [2025])
+
+        invalidate_on_roster_sync()
+        load(2025)
+        self.assertEqual(calls, [2025, 2025])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -83,6 +83,13 @@ class TestConfigurationLoading(unittest.TestCase):
                     f"Missing required section: {section}"
                 )
 
+    def test_cache_dir_anchored_to_project_root(self):
+        """A relative cache_dir should not depend on the working directory."""
+        import backend.config as config
+        cache_dir = Path(config.CACHE_DIR)
+        self.assertTrue(cache_dir.is_absolute())
+        self.assertTrue(cache_dir.is_relative_to(Path(__file__).resolve().parents[2]))
+
 
 class TestScoringConfiguration(unittest.TestCase):
     """Test scoring configuration and usage in SQL queries."""
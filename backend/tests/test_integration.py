@@ -16,6 +16,9 @@ import json
 import tempfile
 import sqlite3
 from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
 
 # Add src to path
 
@@ -180,12 +183,71 @@ class TestTeamIntegration(unittest.TestCase):
         abbr = TEAM_ABBR_MAP.get('Kansas City Chiefs')
         self.assertEqual(abbr, 'KC')
 
+    def test_team_full_name_prefers_full_name_over_aliases(self):
+        """Abbreviation -> name should give the full name, not a short city alias."""
+        from backend.utils.team_utils import get_team_full_name
+
+        for abbr, full_name in TEAM_MAP.items():
+            self.assertEqual(get_team_full_name(abbr), full_name)
+        self.assertEqual(get_team_full_name('XYZ'), 'XYZ')
+
     def test_team_division_consistency(self):
         """Teams should be available in config."""
         # Just verify that teams are loaded
         self.assertGreater(len(TEAM_MAP), 0)
 
 
+class TestBackfillTeamForPicks(unittest.TestCase):
+    """Test resolving 'Unknown' pick teams from the roster."""
+
+    def setUp(self):
+        from backend.database.connection import set_db_path, DEFAULT_DB_PATH
+        from backend.database.migrations import run_migrations
+
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        set_db_path(Path(self.db_path))
+        self.addCleanup(os.remove, self.db_path)
+        self.addCleanup(set_db_path, DEFAULT_DB_PATH)
+        run_migrations()
+
+        from backend.database import add_user, add_week
+        self.user_id = add_user('Tester')
+        self.week_id = add_week(2099, 1)
+        self.roster = pd.DataFrame({
+            'full_name': ['Josh Allen', 'Josh Allen', 'Tyreek Hill', 'Puka Nacua'],
+            'team': ['BUF', 'JAX', 'MIA', 'LA'],
+        })
+
+    def _add_unknown_pick(self, player_name):
+        from backend.database.connection import get_db_context
+        with get_db_context() as conn:
+            conn.execute(
+                "INSERT INTO picks (user_id, week_id, team, player_name) VALUES (?, ?, 'Unknown', ?)",
+                (self.user_id, self.week_id, player_name),
+            )
+
+    def _teams(self):
+        from backend.database.connection import get_db_context
+        with get_db_context() as conn:
+            rows = conn.execute("SELECT player_name, team FROM picks ORDER BY id").fetchall()
+        return [tuple(row) for row in rows]
+
+    def test_exact_and_fuzzy_matches(self):
+        from backend.utils.team_utils import backfill_team_for_picks
+
+        for name in ('josh allen ', 'P.Nacua', 'Nobody Special'):
+            self._add_unknown_pick(name)
+
+        with patch('backend.analytics.nfl_data.load_rosters', return_value=self.roster):
+            result = backfill_team_for_picks(2099)
+
+        self.assertEqual(result, {'updated': 2, 'failed': 1, 'duplicates': 0})
+        self.assertEqual(self._teams(), [
+            ('josh allen ', 'BUF'), ('P.Nacua', 'LA'), ('Nobody Special', 'Unknown'),
+        ])
+
+
 class TestSeasonIntegration(unittest.TestCase):
     """Test season configuration in application context."""
 
@@ -5,8 +5,8 @@ import os
 
 
 
-from backend.analytics.nfl_data import get_touchdowns, get_first_tds
-from backend.utils.name_matching import names_match
+from backend.analytics.nfl_data import get_touchdowns, get_first_tds, process_game_type
+from backend.utils.name_matching import names_match, names_matcher
 
 class TestNFLData(unittest.TestCase):
     def setUp(self):
@@ -58,6 +58,25 @@ class TestNFLData(unittest.TestCase):
         self.assertEqual(g2['play_id'], 20)
         self.assertEqual(g2['td_player_name'], 'Player C')
 
+    def test_process_game_type_classifies_start_time(self):
+        df = pd.DataFrame({'start_time': ['2025-09-07 13:00', '2025-09-08 20:15']})
+        out = process_game_type(df)
+        self.assertEqual(list(out['game_type']), ['Main Slate', 'Standalone'])
+
+    def test_process_game_type_skips_classified_frame(self):
+        df = pd.DataFrame({
+            'start_time': ['2025-09-08 20:15'],
+            'game_type': ['Main Slate'],
+        })
+        out = process_game_type(df)
+        self.assertIs(out, df)
+
+    def test_process_game_type_reclassifies_upstream_codes(self):
+        # nflverse game_type holds REG/POST codes, not slate labels
+        df = pd.DataFrame({'start_time': ['2025-09-07 13:00'], 'game_type': ['REG']})
+        out = process_game_type(df)
+        self.assertEqual(out.iloc[0]['game_type'], 'Main Slate')
+
     def test_names_match(self):
         # Exact match
         self.assertTrue(names_match("Aaron Jones", "Aaron Jones"))
@@ -75,5 +94,13 @@ class TestNFLData(unittest.TestCase):
         # Suffix handling
         self.assertTrue(names_match("Marvin Harrison Jr.", "M.Harrison"))
 
+    def test_names_matcher_agrees_with_names_match(self):
+        candidates = ["Aaron Jones", "A.Jones", "Julio Jones", "A.Rodgers", "Aaron Jonse", "", None]
+        for actual in ("Aaron Jones", "A.Jones", "Marvin Harrison Jr."):
+            match = names_matcher(actual)
+            for picked in candidates:
+                self.assertEqual(match(picked), names_match(picked, actual), (picked, actual))
+        self.assertFalse(names_matcher("")("Aaron Jones"))
+
 if __name__ == '__main__':
     unittest.main()
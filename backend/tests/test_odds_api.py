@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import backend.config as config
+from backend.integrations.odds_api import _markets_are_featured, get_first_td_odds
+from backend.utils.caching import invalidate_cache
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = payload
+    return resp
+
+
+class TestOddsApiBatching(unittest.TestCase):
+    def setUp(self):
+        invalidate_cache("odds_api")
+
+    def tearDown(self):
+        invalidate_cache("odds_api")
+
+    def test_markets_are_featured(self):
+        self.assertTrue(_markets_are_featured("h2h"))
+        self.assertTrue(_markets_are_featured("h2h, spreads,totals"))
+        self.assertFalse(_markets_are_featured("player_anytime_td"))
+        self.assertFalse(_markets_are_featured("h2h,player_anytime_td"))
+        self.assertFalse(_markets_are_featured(""))
+
+    def test_player_prop_market_skips_batch_endpoint(self):
+        events = [
+            {'id': 'e1', 'commence_time': '2025-09-07T17:00:00Z', 'home_team': 'Kansas City Chiefs', 'away_team': 'Buffalo Bills'},
+        ]
+        event_odds = {
+            'bookmakers': [{'markets': [{'key': 'player_anytime_td', 'outcomes': [{'description': 'Travis Kelce', 'price': 450}]}]}],
+        }
+        urls = []
+
+        def fake_get(url, timeout=30):
+            urls.append(url)
+            return _response(events if url.split('?')[0].endswith('/events') else event_odds)
+
+        with patch.object(config, 'ODDS_API_MARKET', 'player_anytime_td'), \
+                patch('backend.integrations.odds_api.requests.get', side_effect=fake_get):
+            odds = get_first_td_odds('key', '2025-09-04', '2025-09-08')
+
+        self.assertEqual(odds, {('KC', 'BUF'): {'Travis Kelce': 450}})
+        self.assertFalse(any('/odds?' in u and '/events/' not in u for u in urls))
+
+    def test_events_missed_by_earlier_batch_survive_later_batch_failure(self):
+        events = [
+            {'id': f'e{n}', 'commence_time': '2025-09-07T17:00:00Z', 'home_team': home, 'away_team': away}
+            for n, (home, away) in enumerate([
+                ('Kansas City Chiefs', 'Buffalo Bills'),
+                ('Miami Dolphins', 'New England Patriots'),
+                ('Dallas Cowboys', 'New York Giants'),
+            ])
+        ]
+        h2h = {'bookmakers': [{'markets': [{'key': 'h2h', 'outcomes': [{'description': 'KC', 'price': -150}]}]}]}
+        # First chunk returns e0 but not e1; the second chunk's batch fails outright
+        batches = iter([{'e0': h2h}, None])
+        fetched = []
+
+        def fake_get(url, timeout=30):
+            if url.split('?')[0].endswith('/events'):
+                return _response(events)
+            fetched.append(url.split('/events/')[1].split('/')[0])
+            return _response(h2h)
+
+        with patch.object(config, 'ODDS_API_MARKET', 'h2h'), \
+                patch.object(config, 'ODDS_API_BATCH_SIZE', 2), \
+                patch('backend.integrations.odds_api._fetch_odds_batch', side_effect=lambda *args: next(batches)), \
+                patch('backend.integrations.odds_api.requests.get', side_effect=fake_get):
+            odds = get_first_td_odds('key', '2025-09-04', '2025-09-08')
+
+        self.assertEqual(fetched, ['e1', 'e2'])
+        self.assertEqual(set(odds), {('KC', 'BUF'), ('MIA', 'NE'), ('DAL', 'NYG')})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from backend.grading.pick_validation import (
+    _build_roster_name_hints,
+    build_existing_pick_index,
+    format_validation_message,
+    validate_pick,
+    validate_pick_batch,
+)
+from backend.utils.roster_index import build_roster_index
+
+
+class TestPickValidation(unittest.TestCase):
+    def setUp(self):
+        self.roster = pd.DataFrame({
+            'full_name': ['Josh Allen', 'Josh Allen', 'Tyreek Hill'],
+            'team': ['BUF', 'JAX', 'MIA'],
+        })
+        self.schedule = pd.DataFrame({
+            'game_id': ['2099_01_BUF_MIA'],
+            'home_team': ['MIA'],
+            'away_team': ['BUF'],
+            'game_date': ['2099-09-07'],
+        })
+
+    def _validate(self, player_name, team, game_id='2099_01_BUF_MIA', odds=500, existing_picks=None):
+        return validate_pick(
+            player_name, team, game_id, odds, None, None,
+            self.roster, self.schedule, existing_picks=existing_picks or [],
+        )
+
+    def test_build_roster_index(self):
+        index = build_roster_index(self.roster)
+        self.assertEqual(index['josh allen'], ('BUF', 'JAX'))
+        self.assertEqual(index['tyreek hill'], ('MIA',))
+        self.assertEqual(build_roster_index(pd.DataFrame()), {})
+
+    def test_build_roster_index_uses_lowercased_column(self):
+        self.roster['full_name_lc'] = ['josh allen', 'josh allen', 'cheetah']
+        index = build_roster_index(self.roster)
+        self.assertEqual(index['cheetah'], ('MIA',))
+        self.assertNotIn('tyreek hill', index)
+
+    def test_roster_index_cached_per_frame(self):
+        with patch('backend.utils.roster_index.build_roster_index', wraps=build_roster_index) as build:
+            self._validate('Josh Allen', 'BUF')
+            self._validate('Tyreek Hill', 'MIA')
+            self.assertEqual(build.call_count, 1)
+
+            # Appending rows changes the frame's size and forces a rebuild
+            self.roster.loc[len(self.roster)] = ['Dawson Knox', 'BUF']
+            _, warnings = self._validate('Dawson Knox', 'BUF')
+            self.assertEqual(build.call_count, 2)
+            self.assertEqual(warnings, [])
+
+    def test_valid_pick(self):
+        errors, warnings = self._validate('josh allen', 'BUF')
+        self.assertEqual(errors, [])
+        self.assertEqual(warnings, [])
+
+    def test_roster_miss_and_mismatch(self):
+        _, warnings = self._validate('Nobody Special', 'BUF')
+        self.assertTrue(any('not found' in w and 'did you mean' not in w for w in warnings))
+
+        _, warnings = self._validate('Tyreek Hil', 'MIA')
+        self.assertTrue(any("did you mean 'Tyreek Hill'?" in w for w in warnings))
+
+        _, warnings = self._validate('Tyreek Hill', 'BUF')
+        self.assertTrue(any('team mismatch' in w for w in warnings))
+
+    def test_roster_suggestion_hints_cached_per_frame(self):
+        with patch('backend.grading.pick_validation._build_roster_name_hints',
+                   wraps=_build_roster_name_hints) as build:
+            _, warnings = self._validate('Tyreek Hil', 'MIA')
+            self.assertTrue(any("did you mean 'Tyreek Hill'?" in w for w in warnings))
+            # Last name intact, first letter wrong: still reached through the last-name bucket
+            _, warnings = self._validate('Hosh Allen', 'BUF')
+            self.assertTrue(any("did you mean 'Josh Allen'?" in w for w in warnings))
+            self.assertEqual(build.call_count, 1)
+
+    def test_game_checks(self):
+        errors, _ = self._validate('Josh Allen', 'BUF', game_id='missing')
+        self.assertTrue(any('not found in schedule' in e for e in errors))
+
+        errors, _ = self._validate('Josh Allen', 'JAX')
+        self.assertTrue(any('not playing in this game' in e for e in errors))
+
+    def test_game_index_prefers_parsed_date_column(self):
+        self.schedule['game_date'] = ['not a date']
+        self.schedule['game_date_ts'] = pd.to_datetime(['2000-09-07'])
+        _, warnings = self._validate('Josh Allen', 'BUF')
+        self.assertIn('Game already started on 09/07/2000 00:00', warnings)
+
+    def test_game_already_started(self):
+        self.schedule['game_date'] = ['2000-09-07']
+        _, warnings = self._validate('Josh Allen', 'BUF')
+        self.assertIn('Game already started on 09/07/2000 00:00', warnings)
+
+        self.schedule['game_date'] = ['not a date']
+        errors, warnings = self._validate('Josh Allen', 'BUF')
+        self.assertEqual((errors, warnings), ([], []))
+
+    def test_stop_on_error_skips_roster_and_duplicate_checks(self):
+        with patch('backend.grading.pick_validation.get_user_week_picks') as fetch:
+            errors, warnings = validate_pick(
+                'Nobody Special', 'BUF', 'missing', 500, 1, 2,
+                self.roster, self.schedule, stop_on_error=True,
+            )
+        fetch.assert_not_called()
+        self.assertEqual(errors, ["Game ID 'missing' not found in schedule"])
+        self.assertEqual(warnings, [])
+
+    def test_existing_pick_checks(self):
+        existing = [{'team': 'BUF', 'game_id': '2099_01_BUF_NYJ', 'player_name': 'JOSH ALLEN'}]
+        errors, warnings = self._validate('Josh Allen', 'BUF', existing_picks=existing)
+        self.assertEqual(errors, ['User already has a pick for BUF in a different game'])
+        self.assertEqual(warnings, ['User is picking Josh Allen in multiple games'])
+
+        existing = [{'team': 'BUF', 'game_id': '2099_01_BUF_MIA', 'player_name': 'Josh Allen'}]
+        errors, warnings = self._validate('Josh Allen', 'BUF', existing_picks=existing)
+        self.assertEqual(errors, [])
+        self.assertEqual(warnings, ['Updating existing pick for BUF', 'Updating existing pick for Josh Allen'])
+
+        # A prebuilt index gives the same result as the raw list
+        index = build_existing_pick_index(existing)
+        self.assertEqual(self._validate('Josh Allen', 'BUF', existing_picks=index), (errors, warnings))
+
+    def test_batch_only_reports_picks_with_issues(self):
+        picks = [
+            {'player_name': 'Josh Allen', 'team': 'BUF', 'game_id': '2099_01_BUF_MIA', 'odds': 500},
+            {'player_name': '', 'team': 'BUF', 'game_id': '2099_01_BUF_MIA', 'odds': 500},
+            {'player_name': '  ', 'team': 'BUF', 'game_id': '2099_01_BUF_MIA', 'odds': 500},
+            {'player_name': 'None', 'team': 'BUF', 'game_id': '2099_01_BUF_MIA', 'odds': 500},
+        ]
+        results = validate_pick_batch(picks, self.roster, self.schedule)
+        self.assertEqual(list(results), [1, 2, 3])
+        for idx in (1, 2, 3):
+            self.assertEqual(results[idx][0], ['Player name is required'])
+
+    def test_batch_fetches_existing_picks_once_per_user_week(self):
+        picks = [
+            {'player_name': 'Josh Allen', 'team': 'BUF', 'game_id': '2099_01_BUF_MIA', 'odds': 500, 'user_id': 1, 'week_id': 2},
+            {'player_name': 'Tyreek Hill', 'team': 'MIA', 'game_id': '2099_01_BUF_MIA', 'odds': 500, 'user_id': 1, 'week_id': 2},
+        ]
+        with patch('backend.grading.pick_validation.get_user_week_picks', return_value=[]) as fetch:
+            validate_pick_batch(picks, self.roster, self.schedule)
+        fetch.assert_called_once_with(1, 2)
+
+    def test_format_validation_message(self):
+        message = format_validation_message(['e1', 'e2'], ['w1'])
+        self.assertEqual(message, "**❌ Errors:**\n  • e1\n  • e2\n**⚠️ Warnings:**\n  • w1")
+        self.assertEqual(format_validation_message([], ['w1']), "**⚠️ Warnings:**\n  • w1")
+        self.assertEqual(format_validation_message([], []), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,244 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from backend.integrations.polymarket import (
+    _NOT_FOUND,
+    _american_odds_vec,
+    _fetch_markets_by_slug,
+    _history_to_records,
+    PolymarketClient,
+    build_market_slug,
+    extract_teams_from_question,
+    get_polymarket_odds_by_slug,
+    probability_to_american_odds,
+)
+
+
+class TestPolymarketSlugLookup(unittest.TestCase):
+    def test_build_market_slug(self):
+        slug = build_market_slug('SEA', 'NE', '2026-02-08', "Ja'Marr Chase Jr.")
+        self.assertEqual(slug, 'nfl-sea-ne-2026-02-08-first-td-jamarr-chase-jr')
+
+    def setUp(self):
+        self.diggs_slug = build_market_slug('SEA', 'NE', '2026-02-08', 'Stefon Diggs')
+        self.walker_slug = build_market_slug('SEA', 'NE', '2026-02-08', 'Kenneth Walker')
+
+    def test_extract_teams_from_question(self):
+        self.assertEqual(extract_teams_from_question('First TD in Chiefs VS. Bills?'), ('KC', 'BUF'))
+        self.assertEqual(extract_teams_from_question('Seahawks @ New England Patriots first TD'), ('SEA', 'NE'))
+        self.assertEqual(extract_teams_from_question('Will Josh Allen score first in BUF at KC?'), ('BUF', 'KC'))
+        # Lowercase words that happen to be abbreviations are not teams
+        self.assertEqual(extract_teams_from_question('No first TD in ten minutes for the Ravens?'), (None, None))
+        self.assertEqual(extract_teams_from_question('Who scores first?'), (None, None))
+
+    def test_extract_teams_ignores_player_named_like_a_city(self):
+        question = 'Will Dallas Goedert score the first touchdown in Eagles vs Giants?'
+        self.assertEqual(extract_teams_from_question(question), ('PHI', 'NYG'))
+        self.assertEqual(extract_teams_from_question('Dallas Goedert first TD: Eagles @ Giants'), ('PHI', 'NYG'))
+        # No matchup: fall back to the first two teams mentioned
+        self.assertEqual(extract_teams_from_question('Chiefs and Bills: first TD scorer'), ('KC', 'BUF'))
+
+    def test_search_first_td_markets_dedupes_and_filters(self):
+        market = {
+            'conditionId': 'c1',
+            'question': 'Will Travis Kelce score the first TD in Chiefs vs Bills?',
+            'outcomePrices': '["0.25", "0.75"]',
+            'clobTokenIds': '["yes", "no"]',
+            'endDate': '2026-01-05T01:00:00Z',
+        }
+        first = dict(market, conditionId='c3', question='Will Josh Allen score the 1st TD in Bills vs Chiefs?')
+        anytime = dict(market, conditionId='c4', question='Josh Allen anytime TD in Bills vs Chiefs?')
+        # A market repeated across pages is only reported once
+        pages = [
+            [market, {'conditionId': 'c2', 'question': 'Chiefs to win?'}],
+            [market, first],
+            [anytime],
+        ]
+        client = PolymarketClient()
+        with patch('backend.integrations.polymarket._SEARCH_PAGE_SIZE', 2), \
+                patch.object(client, 'search_text', side_effect=pages) as search:
+            markets = client.search_nfl_first_td_markets()
+
+        self.assertEqual(
+            [(c.args[0], c.kwargs['offset']) for c in search.call_args_list],
+            [('NFL first', 0), ('NFL first', 2), ('NFL first', 4)],
+        )
+        self.assertEqual([m.condition_id for m in markets], ['c1', 'c3', 'c4'])
+        self.assertEqual(markets[0].outcome_prices, [0.25, 0.75])
+        self.assertEqual(markets[0].token_ids, ['yes', 'no'])
+        self.assertEqual(markets[0].end_date.year, 2026)
+
+    def test_price_history_decodes_in_full_or_streams(self):
+        client = PolymarketClient()
+        points = [{'t': 1700000000, 'p': 0.2}]
+        with patch('backend.integrations.polymarket.HAS_IJSON', False), \
+                patch.object(client, '_make_request', return_value={'history': points}):
+            self.assertEqual(client.get_price_history('tok'), points)
+
+        with patch('backend.integrations.polymarket.HAS_IJSON', True), \
+                patch.object(client, '_make_request', return_value=points) as request:
+            self.assertEqual(client.get_price_history('tok'), points)
+        self.assertTrue(request.call_args.kwargs['stream'])
+
+    def test_streamed_responses_are_closed(self):
+        def response(status):
+            resp = MagicMock(status_code=status, headers={})
+            resp.raise_for_status.side_effect = (
+                requests.exceptions.HTTPError(str(status)) if status >= 400 else None
+            )
+            return resp
+
+        def bad_parse(resp):
+            raise ValueError("truncated")
+
+        client = PolymarketClient()
+        retried, ok = response(503), response(200)
+        with patch.object(client.session, 'get', side_effect=[retried, ok]), \
+                patch('backend.utils.resilience.time.sleep'):
+            self.assertIsNone(client._make_request('https://clob.test', 'x', stream=True, parse=bad_parse))
+        retried.close.assert_called_once()
+        ok.close.assert_called_once()
+
+        not_found = response(404)
+        with patch.object(client.session, 'get', return_value=not_found):
+            self.assertIsNone(client._make_request('https://clob.test', 'x', stream=True, parse=bad_parse))
+        not_found.close.assert_called_once()
+
+    def test_american_odds_vec_matches_scalar(self):
+        probs = [-0.1, 0, 0.01, 0.2, 0.25, 0.5, 0.8, 0.999, 1, 1.5]
+        self.assertEqual(
+            _american_odds_vec(probs).tolist(),
+            [probability_to_american_odds(p) for p in probs],
+        )
+
+    def test_history_to_records(self):
+        history = [
+            {'t': 1700000000, 'p': '0.25'},
+            {'t': 0, 'p': 0.3},
+            {'timestamp': '2025-01-01', 'price': 0.1},
+            {'t': 1710054000.5, 'p': 0.5},
+        ]
+        self.assertEqual(_history_to_records(history), [
+            {'timestamp': datetime.fromtimestamp(1700000000), 'price': 0.25},
+            {'timestamp': '2025-01-01', 'price': 0.1},
+            {'timestamp': datetime.fromtimestamp(1710054000.5), 'price': 0.5},
+        ])
+        self.assertEqual(_history_to_records([]), [])
+
+    def test_get_markets_by_slugs_sends_one_request(self):
+        client = PolymarketClient()
+        response = [{'slug': self.diggs_slug, 'conditionId': 'c1'}, {'conditionId': 'no-slug'}]
+        with patch.object(client, '_make_request', return_value=response) as request:
+            by_slug = client.get_markets_by_slugs([self.diggs_slug, self.walker_slug])
+
+        request.assert_called_once_with(
+            PolymarketClient.GAMMA_BASE_URL, 'markets',
+            [('slug', self.diggs_slug), ('slug', self.walker_slug), ('limit', 2)],
+        )
+        self.assertEqual(by_slug, {self.diggs_slug: response[0]})
+
+        # Both the hit and the miss are now cached, so no further request is made
+        with patch.object(client, '_make_request') as request:
+            self.assertEqual(client.get_markets_by_slugs([self.diggs_slug, self.walker_slug]), by_slug)
+        request.assert_not_called()
+
+        fresh_client = PolymarketClient()
+        with patch.object(fresh_client, '_make_request', return_value=None):
+            self.assertIsNone(fresh_client.get_markets_by_slugs([self.diggs_slug]))
+
+    def test_get_markets_by_slugs_trusts_only_filtered_responses(self):
+        # Unrequested markets mean the filter was ignored: nothing is cached as a miss
+        client = PolymarketClient()
+        with patch.object(client, '_make_request', return_value=[{'slug': 'unrelated', 'conditionId': 'c9'}]):
+            self.assertIsNone(client.get_markets_by_slugs([self.diggs_slug, self.walker_slug]))
+        with patch.object(client, '_make_request', return_value={'slug': self.diggs_slug}) as request:
+            self.assertEqual(client.get_market_by_slug(self.diggs_slug), {'slug': self.diggs_slug})
+        request.assert_called_once()
+
+        # An empty list is an authoritative "none of these exist"
+        client = PolymarketClient()
+        with patch.object(client, '_make_request', return_value=[]):
+            self.assertEqual(client.get_markets_by_slugs([self.diggs_slug, self.walker_slug]), {})
+        with patch.object(client, '_make_request') as request:
+            self.assertIsNone(client.get_market_by_slug(self.walker_slug))
+        request.assert_not_called()
+
+    def test_fetch_markets_by_slug_falls_back_only_when_filter_ignored(self):
+        client = PolymarketClient()
+        with patch.object(client, 'get_markets_by_slugs', return_value={}), \
+                patch.object(client, 'get_market_by_slug') as single:
+            self.assertEqual(_fetch_markets_by_slug(client, ['a', 'b']), [None, None])
+        single.assert_not_called()
+
+        with patch.object(client, 'get_markets_by_slugs', return_value=None), \
+                patch.object(client, 'get_market_by_slug', side_effect={'a': {'slug': 'a'}}.get) as single:
+            self.assertEqual(_fetch_markets_by_slug(client, ['a', 'b']), [{'slug': 'a'}, None])
+        self.assertEqual(single.call_count, 2)
+
+    def test_market_by_slug_caches_hits_and_misses(self):
+        client = PolymarketClient(cache_ttl=3600)
+        with patch.object(client, '_make_request', side_effect=[{'slug': 'a'}, _NOT_FOUND, _NOT_FOUND]) as request, \
+                patch('backend.integrations.polymarket.time.monotonic', return_value=1000.0) as clock:
+            self.assertEqual(client.get_market_by_slug('a'), {'slug': 'a'})
+            self.assertIsNone(client.get_market_by_slug('b'))
+            self.assertEqual(client.get_market_by_slug('a'), {'slug': 'a'})
+            self.assertIsNone(client.get_market_by_slug('b'))
+            self.assertEqual(request.call_count, 2)
+
+            # Misses expire after a minute, hits only after cache_ttl
+            clock.return_value = 1061.0
+            self.assertEqual(client.get_market_by_slug('a'), {'slug': 'a'})
+            self.assertIsNone(client.get_market_by_slug('b'))
+            self.assertEqual(request.call_count, 3)
+
+    def test_market_by_slug_does_not_cache_transient_failures(self):
+        client = PolymarketClient()
+        # None is a timeout / 5xx / open breaker, not a 404
+        with patch.object(client, '_make_request', side_effect=[None, {'slug': 'a'}]) as request:
+            self.assertIsNone(client.get_market_by_slug('a'))
+            self.assertEqual(client.get_market_by_slug('a'), {'slug': 'a'})
+        self.assertEqual(request.call_count, 2)
+        self.assertIs(request.call_args.kwargs['not_found'], _NOT_FOUND)
+
+    def test_odds_by_slug_uses_batch_lookup(self):
+        batch = {self.walker_slug: {'outcomePrices': ['0.5', '0.5'], 'slug': self.walker_slug}}
+        with patch('backend.integrations.polymarket.config.POLYMARKET_ENABLED', True), \
+                patch.object(PolymarketClient, 'get_markets_by_slugs', return_value=batch), \
+                patch.object(PolymarketClient, 'get_market_by_slug') as single:
+            results = get_polymarket_odds_by_slug('SEA', 'NE', '2026-02-08', ['Stefon Diggs', 'Kenneth Walker'])
+
+        single.assert_not_called()
+        self.assertEqual(list(results), ['Kenneth Walker'])
+
+    def test_odds_by_slug_falls_back_to_single_lookups(self):
+        markets = {
+            self.diggs_slug: {
+                'outcomePrices': '["0.2", "0.8"]',
+                'clobTokenIds': '["yes", "no"]',
+                'conditionId': 'c1',
+                'volume': '10',
+            },
+            self.walker_slug: {
+                'outcomePrices': ['0.1', '0.9'],
+                'conditionId': 'c2',
+            },
+        }
+        with patch('backend.integrations.polymarket.config.POLYMARKET_ENABLED', True), \
+                patch.object(PolymarketClient, 'get_markets_by_slugs', return_value=None), \
+                patch.object(PolymarketClient, 'get_market_by_slug', side_effect=markets.get):
+            results = get_polymarket_odds_by_slug(
+                'SEA', 'NE', '2026-02-08', ['Stefon Diggs', 'Nobody', 'Kenneth Walker'],
+            )
+
+        self.assertEqual(list(results), ['Stefon Diggs', 'Kenneth Walker'])
+        self.assertEqual(results['Stefon Diggs']['american_odds'], 400)
+        self.assertEqual(results['Stefon Diggs']['token_ids'], ['yes', 'no'])
+        self.assertEqual(results['Stefon Diggs']['volume'], 10.0)
+        self.assertEqual(results['Kenneth Walker']['condition_id'], 'c2')
+
+
+if __name__ == '__main__':
+    unittest.main()
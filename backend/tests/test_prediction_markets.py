@@ -0,0 +1,284 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from backend.integrations.prediction_markets import (
+    MarketOddsRecord,
+    PredictionMarketAggregator,
+    link_odds_to_first_td_results,
+    test_connections as probe_connections,
+)
+
+
+class TestPredictionMarketAggregator(unittest.TestCase):
+    def setUp(self):
+        for name in ('POLYMARKET_ENABLED', 'KALSHI_ENABLED'):
+            patcher = patch(f'backend.integrations.prediction_markets.config.{name}', True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch('backend.integrations.prediction_markets.config.PREDICTION_MARKETS_ENABLED_SOURCES',
+                        ['polymarket', 'kalshi'])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = patch('backend.utils.caching.config.CACHE_DIR', self._tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.aggregator = self._new_aggregator()
+
+        self.pm_odds = {('KC', 'BUF'): {'Travis Kelce': {'implied_probability': 0.2, 'american_odds': 400,
+                                                           'condition_id': 'c1', 'price': 0.2}}}
+        self.kalshi_odds = {('KC', 'BUF'): {'Travis Kelce': {'implied_probability': 0.3, 'american_odds': 233,
+                                                           'ticker': 'T1', 'price': 0.3}}}
+
+    def _new_aggregator(self):
+        with patch('backend.integrations.prediction_markets.PolymarketClient'), \
+                patch('backend.integrations.prediction_markets.KalshiClient'):
+            return PredictionMarketAggregator()
+
+    def _patch_fetchers(self, pm, kalshi):
+        return (
+            patch('backend.integrations.prediction_markets.get_polymarket_first_td_odds', side_effect=pm),
+            patch('backend.integrations.prediction_markets.get_kalshi_first_td_odds', side_effect=kalshi),
+        )
+
+    def test_sources_fetched_concurrently_and_merged_in_order(self):
+        # Each fetch waits for the other, which only succeeds if they run at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def pm(*args):
+            barrier.wait()
+            return self.pm_odds
+
+        def kalshi(*args):
+            barrier.wait()
+            return self.kalshi_odds
+
+        pm_patch, kalshi_patch = self._patch_fetchers(pm, kalshi)
+        with pm_patch, kalshi_patch:
+            all_odds = self.aggregator.get_first_td_odds('2025-09-04', '2025-09-08')
+
+        records = all_odds[('KC', 'BUF')]
+        self.assertEqual([(r.source, r.market_id) for r in records], [('polymarket', 'c1'), ('kalshi', 'T1')])
+
+    def test_async_variant_shares_the_cache(self):
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: self.pm_odds, lambda *args: self.kalshi_odds)
+        with pm_patch as pm, kalshi_patch:
+            async_odds = asyncio.run(self.aggregator.get_first_td_odds_async('2025-09-04', '2025-09-08'))
+            sync_odds = self.aggregator.get_first_td_odds('2025-09-04', '2025-09-08')
+        self.assertEqual(async_odds, sync_odds)
+        self.assertEqual(pm.call_count, 1)
+
+    def test_failing_source_is_skipped(self):
+        def pm(*args):
+            raise RuntimeError("down")
+
+        pm_patch, kalshi_patch = self._patch_fetchers(pm, lambda *args: self.kalshi_odds)
+        with pm_patch, kalshi_patch:
+            all_odds = self.aggregator.get_first_td_odds('2025-09-04', '2025-09-08')
+        self.assertEqual([r.source for r in all_odds[('KC', 'BUF')]], ['kalshi'])
+
+    def test_disabled_sources_are_not_fetched(self):
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: self.pm_odds, lambda *args: self.kalshi_odds)
+        with pm_patch as pm, kalshi_patch as kalshi:
+            all_odds = self.aggregator.get_first_td_odds('2025-09-04', '2025-09-08', sources=['kalshi'])
+        pm.assert_not_called()
+        kalshi.assert_called_once_with('2025-09-04', '2025-09-08')
+        self.assertEqual(len(all_odds[('KC', 'BUF')]), 1)
+
+    def test_odds_cached_per_week_until_invalidated(self):
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: self.pm_odds, lambda *args: self.kalshi_odds)
+        with pm_patch as pm, kalshi_patch:
+            first = self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+            self.assertEqual(self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08'), first)
+            self.assertEqual(pm.call_count, 1)
+
+            # Different sources or weeks are separate entries
+            self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08', sources=['polymarket'])
+            self.aggregator.get_first_td_odds('2099-09-11', '2099-09-15')
+            self.assertEqual(pm.call_count, 3)
+
+            self.aggregator.invalidate('2099-09-04', '2099-09-08')
+            self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+            self.aggregator.get_first_td_odds('2099-09-11', '2099-09-15')
+            self.assertEqual(pm.call_count, 4)
+
+    def test_disk_cache_shared_between_aggregators(self):
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: self.pm_odds, lambda *args: self.kalshi_odds)
+        with pm_patch as pm, kalshi_patch:
+            first = self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+            # A second aggregator (e.g. another worker process) reads the shared copy
+            other = self._new_aggregator().get_first_td_odds('2099-09-04', '2099-09-08')
+            self.assertEqual(other, first)
+            self.assertEqual(pm.call_count, 1)
+
+            self.aggregator.invalidate('2099-09-04', '2099-09-08')
+            self._new_aggregator().get_first_td_odds('2099-09-04', '2099-09-08')
+            self.assertEqual(pm.call_count, 2)
+
+    def test_disk_hit_keeps_remaining_ttl(self):
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: self.pm_odds, lambda *args: self.kalshi_odds)
+        with pm_patch, kalshi_patch:
+            self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+            # Age the shared copy by 200s of its 300s TTL
+            for path in Path(self._tmp.name).rglob('*.pkl'):
+                mtime = path.stat().st_mtime - 200
+                os.utime(path, (mtime, mtime))
+
+            other = self._new_aggregator()
+            other.get_first_td_odds('2099-09-04', '2099-09-08')
+            stored_at, _ = other._odds_cache[('2099-09-04', '2099-09-08', ('kalshi', 'polymarket'))]
+            self.assertGreaterEqual(time.monotonic() - stored_at, 200)
+
+    def test_stale_odds_served_while_refreshing(self):
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: self.pm_odds, lambda *args: self.kalshi_odds)
+        with pm_patch as pm, kalshi_patch:
+            first = self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+            key = ('2099-09-04', '2099-09-08', ('kalshi', 'polymarket'))
+            stored_at, odds = self.aggregator._odds_cache[key]
+            self.aggregator._odds_cache[key] = (stored_at - 400, odds)
+
+            with patch('backend.integrations.prediction_markets.threading.Thread') as thread:
+                self.assertEqual(self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08'), first)
+                self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+            # Only one refresh is scheduled per key
+            thread.assert_called_once()
+            thread.call_args.kwargs['target']()
+
+            self.assertEqual(pm.call_count, 2)
+            self.assertIsNot(self.aggregator._odds_cache[key][1], odds)
+            self.assertEqual(self.aggregator._refreshing, set())
+
+    def test_callers_cannot_mutate_cached_odds(self):
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: self.pm_odds, lambda *args: self.kalshi_odds)
+        with pm_patch, kalshi_patch:
+            first = self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+            first[('KC', 'BUF')].clear()
+            first[('NYJ', 'MIA')] = []
+            again = self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+        self.assertEqual(list(again), [('KC', 'BUF')])
+        self.assertEqual(len(again[('KC', 'BUF')]), 2)
+
+    def test_empty_results_are_not_cached(self):
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: {}, lambda *args: {})
+        with pm_patch as pm, kalshi_patch:
+            self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+            self.aggregator.get_first_td_odds('2099-09-04', '2099-09-08')
+        self.assertEqual(pm.call_count, 2)
+
+    def test_games_served_from_one_week_fetch(self):
+        self.pm_odds[('SEA', 'NE')] = {'Kenneth Walker': {'implied_probability': 0.1, 'condition_id': 'c2'}}
+        pm_patch, kalshi_patch = self._patch_fetchers(lambda *args: self.pm_odds, lambda *args: self.kalshi_odds)
+        with pm_patch as pm, kalshi_patch:
+            week_odds = self.aggregator.prefetch_week('2099-09-04', '2099-09-08')
+            kc_game = self.aggregator.get_odds_for_game('BUF', 'KC', '2099-09-04', '2099-09-08')
+            sea_game = self.aggregator.get_odds_for_game('SEA', 'NE', '2099-09-04', '2099-09-08', week_odds=week_odds)
+
+        self.assertEqual(pm.call_count, 1)
+        self.assertEqual([r.source for r in kc_game['Travis Kelce']], ['polymarket', 'kalshi'])
+        self.assertEqual(list(sea_game), ['Kenneth Walker'])
+
+    def test_arbitrage_reports_widest_spread_per_player(self):
+        def record(source, prob, player='Travis Kelce'):
+            return MarketOddsRecord(source, player, prob, 0, None, datetime(2025, 9, 4), source, prob)
+
+        odds_by_player = {
+            'Travis Kelce': [record('polymarket', 0.20), record('kalshi', 0.32), record('odds_api', 0.12)],
+            'Rashee Rice': [record('polymarket', 0.10, 'Rashee Rice'), record('kalshi', 0.13, 'Rashee Rice')],
+            'Isiah Pacheco': [record('kalshi', 0.3, 'Isiah Pacheco')],
+        }
+        opportunities = PredictionMarketAggregator.find_arbitrage_opportunities(odds_by_player)
+
+        self.assertEqual(len(opportunities), 1)
+        self.assertEqual(
+            (opportunities[0]['source1'], opportunities[0]['source2']), ('odds_api', 'kalshi'))
+        self.assertAlmostEqual(opportunities[0]['prob_diff'], 0.20)
+
+    def test_records_are_immutable(self):
+        record = MarketOddsRecord('kalshi', 'Travis Kelce', 0.2, 400, None, datetime(2025, 9, 4), 'T1', 0.2)
+        with self.assertRaises(AttributeError):
+            record.implied_probability = 0.5
+        self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_arbitrage_segments_do_not_bleed_between_players(self):
+        def record(source, prob, player):
+            return MarketOddsRecord(source, player, prob, 0, None, datetime(2025, 9, 4), source, prob)
+
+        odds_by_player = {
+            'A': [record('polymarket', 0.50, 'A'), record('kalshi', 0.52, 'A')],
+            'B': [record('kalshi', 0.05, 'B'), record('polymarket', 0.15, 'B'), record('odds_api', 0.10, 'B')],
+            'C': [record('polymarket', 0.40, 'C'), record('kalshi', 0.32, 'C')],
+        }
+        opportunities = PredictionMarketAggregator.find_arbitrage_opportunities(odds_by_player)
+
+        self.assertEqual(
+            [(o['player'], o['source1'], o['source2']) for o in opportunities],
+            [('B', 'kalshi', 'polymarket'), ('C', 'kalshi', 'polymarket')])
+        self.assertEqual(PredictionMarketAggregator.find_arbitrage_opportunities({}), [])
+
+
+class TestConnectionProbes(unittest.TestCase):
+    def test_sources_probed_concurrently_and_failures_isolated(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def tags():
+            barrier.wait()
+            raise RuntimeError("down")
+
+        def markets(limit):
+            barrier.wait()
+            return [{'ticker': 'T1'}], None
+
+        with patch('backend.integrations.prediction_markets.config.POLYMARKET_ENABLED', True), \
+                patch('backend.integrations.prediction_markets.config.KALSHI_ENABLED', True), \
+                patch('backend.integrations.prediction_markets.PolymarketClient') as pm_client, \
+                patch('backend.integrations.prediction_markets.KalshiClient') as kalshi_client:
+            pm_client.return_value.get_all_tags.side_effect = tags
+            kalshi_client.return_value.get_markets.side_effect = markets
+            results = probe_connections()
+
+        self.assertEqual(results, {'polymarket': False, 'kalshi': True})
+
+
+class TestLinkOddsToResults(unittest.TestCase):
+    def setUp(self):
+        from backend.database.connection import set_db_path, DEFAULT_DB_PATH
+        from backend.database.migrations import run_migrations
+
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        set_db_path(Path(self.db_path))
+        self.addCleanup(os.remove, self.db_path)
+        self.addCleanup(set_db_path, DEFAULT_DB_PATH)
+        run_migrations()
+
+    def test_outcomes_written_and_favorite_scored(self):
+        from backend.database.market_odds import add_market_odds_batch, get_market_outcomes_for_game
+
+        add_market_odds_batch([
+            {'source': 'polymarket', 'game_id': 'g1', 'season': 2025, 'week': 1, 'player_name': name,
+             'implied_probability': prob, 'market_id': f'm-{name}', 'snapshot_time': '2025-09-04 12:00:00'}
+            for name, prob in (('Travis Kelce', 0.25), ('Rashee Rice', 0.15), ('Isiah Pacheco', 0.1))
+        ])
+
+        first_tds = {'g1': {'player': 'Travis Kelce'}, 'g2': {'player': None}}
+        with patch('backend.grading.grading_logic.get_first_td_scorers', return_value=first_tds, create=True):
+            stats = link_odds_to_first_td_results(2025, 1)
+
+        self.assertEqual(stats['games_processed'], 1)
+        self.assertEqual(stats['odds_linked'], 3)
+        self.assertEqual(stats['matches_found'], 1)
+        self.assertEqual(stats['favorites_correct'], 1)
+        outcomes = {o['player_name']: o['resolved_outcome'] for o in get_market_outcomes_for_game('g1')}
+        self.assertEqual(outcomes, {'Travis Kelce': 'yes', 'Rashee Rice': 'no', 'Isiah Pacheco': 'no'})
+
+
+if __name__ == '__main__':
+    unittest.main()
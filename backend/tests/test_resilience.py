@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import patch
+
+from backend.utils.resilience import (
+    MAX_RETRY_AFTER_SECONDS,
+    CircuitBreaker,
+    RateLimiter,
+    _backoff_delay,
+    request_with_retry,
+)
+
+
+class TestRequestWithRetry(unittest.TestCase):
+    def _retry(self, statuses, **kwargs):
+        calls = iter(statuses)
+        return request_with_retry(
+            lambda: next(calls),
+            breaker=CircuitBreaker(failure_threshold=100),
+            retries=3,
+            backoff_base=1.0,
+            backoff_factor=2.0,
+            jitter=0.0,
+            retry_on_statuses=(503,),
+            get_status=lambda status: status,
+            **kwargs,
+        )
+
+    def test_retries_until_success(self):
+        with patch('backend.utils.resilience.time.sleep') as sleep:
+            self.assertEqual(self._retry([503, 503, 200]), 200)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1.0, 2.0])
+
+    def test_deadline_stops_retrying(self):
+        with patch('backend.utils.resilience.time.sleep') as sleep, \
+                patch('backend.utils.resilience.time.monotonic', return_value=100.0):
+            self.assertEqual(self._retry([503, 503, 200], deadline=101.5), 503)
+        # The first 1s backoff fits in the budget, the following 2s one does not
+        self.assertEqual(sleep.call_count, 1)
+
+    def test_full_jitter_stays_within_capped_window(self):
+        with patch('backend.utils.resilience.random.uniform', side_effect=lambda lo, hi: hi) as uniform:
+            self.assertEqual(_backoff_delay(5, 1.0, 2.0, 0.5, cap=8.0, full_jitter=True), 8.0)
+        uniform.assert_called_once_with(0, 8.0)
+        self.assertEqual(_backoff_delay(1, 1.0, 2.0, 0.0), 2.0)
+
+    class Response:
+        def __init__(self, status, headers=None):
+            self.status_code = status
+            self.headers = headers or {}
+
+    def test_retry_after_sets_minimum_delay_and_pauses_limiter(self):
+        Response = self.Response
+        limiter = RateLimiter(rate=0)
+        calls = iter([Response(429, {'Retry-After': '5'}), Response(200)])
+        with patch('backend.utils.resilience.time.sleep') as sleep:
+            result = request_with_retry(
+                lambda: next(calls),
+                breaker=CircuitBreaker(failure_threshold=100),
+                retries=3, backoff_base=1.0, backoff_factor=2.0, jitter=0.0,
+                retry_on_statuses=(429,),
+                get_status=lambda resp: resp.status_code,
+                rate_limiter=limiter,
+            )
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [5.0])
+        self.assertGreater(limiter._paused_until, 0)
+
+    def test_huge_retry_after_gives_up_and_caps_pause(self):
+        Response = self.Response
+        limiter = RateLimiter(rate=0)
+        calls = iter([Response(429, {'Retry-After': '3600'}), Response(200)])
+        with patch('backend.utils.resilience.time.sleep') as sleep, \
+                patch('backend.utils.resilience.time.monotonic', return_value=100.0):
+            result = request_with_retry(
+                lambda: next(calls),
+                breaker=CircuitBreaker(failure_threshold=100),
+                retries=3, backoff_base=1.0, backoff_factor=2.0, jitter=0.0,
+                retry_on_statuses=(429,),
+                get_status=lambda resp: resp.status_code,
+                rate_limiter=limiter,
+            )
+        self.assertEqual(result.status_code, 429)
+        sleep.assert_not_called()
+        self.assertEqual(limiter._paused_until, 100.0 + MAX_RETRY_AFTER_SECONDS)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_then_throttles_to_rate(self):
+        limiter = RateLimiter(rate=2, burst=2)
+        with patch('backend.utils.resilience.time.monotonic', return_value=10.0), \
+                patch('backend.utils.resilience.time.sleep') as sleep:
+            limiter._updated = 10.0
+            limiter.acquire()
+            limiter.acquire()
+            sleep.assert_not_called()
+            limiter.acquire()
+            limiter.acquire()
+        # Two calls past the burst owe half a second and one second respectively
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.5, 1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
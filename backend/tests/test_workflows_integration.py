@@ -75,6 +75,36 @@ class BaseWorkflowTest(unittest.TestCase):
 class TestCSVImportWorkflow(BaseWorkflowTest):
     """Test CSV import pipeline: validation -> database storage."""
     
+    def test_admin_csv_import_is_all_or_nothing(self):
+        """A decode error late in the upload rolls back rows already inserted."""
+        import asyncio
+        import io
+        from fastapi import HTTPException, UploadFile
+        from backend.api.routers.fastapi_admin import _import_picks_csv, import_picks_csv
+
+        user_id = add_user("John Doe", "john@example.com")
+        week_id = add_week(2025, 1)
+        add_pick(user_id, week_id, 'KC', 'Patrick Mahomes', 150)
+
+        good = b"User,Player,Team,Odds\nJohn Doe,Travis Kelce,KC,400\nJohn Doe,Patrick Mahomes,KC,150\n"
+        imported, errors = _import_picks_csv(io.BytesIO(good), week_id)
+        self.assertEqual(imported, 1)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('Duplicate pick', errors[0])
+
+        # Enough valid rows that the bad byte lands past the first decoded block
+        rows = b"".join(b"John Doe,Player %d,KC,500\n" % n for n in range(1000))
+        bad = b"User,Player,Team,Odds\n" + rows + b"John Doe,Bad \xff Name,KC,500\n"
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(import_picks_csv(
+                file=UploadFile(io.BytesIO(bad), filename='picks.csv'),
+                week_id=week_id,
+                current_user={'name': 'admin'},
+            ))
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertIn('UTF-8', ctx.exception.detail)
+        self.assertEqual(len(get_user_week_picks(user_id, week_id)), 2)
+
     def test_import_workflow_basic_picks(self):
         """Test basic CSV import workflow: user add -> week add -> pick add."""
         # Step 1: Add users
@@ -12,9 +12,13 @@ Features:
 - Cache statistics tracking
 """
 
+import hashlib
 import logging
 import os
+import pickle
+import tempfile
 import time
+from pathlib import Path
 from typing import Optional, Callable, Any, Dict, TypeVar, Tuple
 from functools import wraps
 from dataclasses import dataclass, field
@@ -146,6 +150,11 @@ def invalidate_on_team_ratings_update() -> None:
     invalidate_cache("team_ratings")
 
 
+def invalidate_on_roster_sync() -> None:
+    """Called after rosters are re-synced from nflreadpy."""
+    invalidate_cache("nfl_rosters")
+
+
 # ============= CACHING DECORATORS =============
 
 def cached(ttl: int, cache_name: Optional[str] = None):
@@ -201,6 +210,105 @@ def cached(ttl: int, cache_name: Optional[str] = None):
     return decorator
 
 
+def _disk_cache_path(cache_name: str, key: str) -> Path:
+    return Path(config.CACHE_DIR) / cache_name / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+
+
+def disk_cache_get(cache_name: str, key: str, ttl: float) -> Optional[Any]:
+    """
+    Read a value persisted by disk_cache_set, or None if missing/expired/unreadable.
+
+    Empty values are never persisted, so None always means "not cached".
+    """
+    hit = disk_cache_get_with_age(cache_name, key, ttl)
+    return hit[0] if hit is not None else None
+
+
+def disk_cache_get_with_age(cache_name: str, key: str, ttl: float) -> Optional[Tuple[Any, float]]:
+    """
+    Like disk_cache_get, but return (value, age_seconds) so callers layering an
+    in-memory cache on top can expire it with the file instead of restarting the TTL.
+    """
+    if os.environ.get('FAST6_DISABLE_CACHING') == '1':
+        return None
+    path = _disk_cache_path(cache_name, key)
+    try:
+        age = max(0.0, time.time() - path.stat().st_mtime)
+        if age < ttl:
+            with open(path, 'rb') as f:
+                return pickle.load(f), age
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable disk cache entry {path}: {e}")
+    return None
+
+
+def disk_cache_set(cache_name: str, key: str, value: Any) -> None:
+    """Persist a non-empty value under CACHE_DIR/<cache_name>/ (shared across processes)."""
+    if value and os.environ.get('FAST6_DISABLE_CACHING') != '1':
+        _write_pickle_atomic(_disk_cache_path(cache_name, key), value)
+
+
+def disk_cache_clear(cache_name: str) -> None:
+    """Remove every entry stored under cache_name."""
+    directory = Path(config.CACHE_DIR) / cache_name
+    try:
+        for path in directory.glob('*.pkl'):
+            path.unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning(f"Could not clear disk cache {directory}: {e}")
+
+
+def disk_cached(ttl: int, cache_name: str):
+    """
+    Decorator persisting results as pickles under CACHE_DIR/<cache_name>/.
+
+    Intended as a second level beneath @cached: entries survive restarts and
+    are shared between worker processes. Files older than ttl are ignored,
+    empty results are not persisted (so an upstream outage can't replace good
+    data), and any disk error falls through to calling the function.
+
+    Args:
+        ttl: Time to live in seconds (checked against file mtime)
+        cache_name: Subdirectory for this cache's files
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            if os.environ.get('FAST6_DISABLE_CACHING') == '1':
+                return func(*args, **kwargs)
+
+            call_key = str((func.__name__, args, tuple(sorted(kwargs.items()))))
+            result = disk_cache_get(cache_name, call_key, ttl)
+            if result is not None:
+                return result
+
+            result = func(*args, **kwargs)
+            disk_cache_set(cache_name, call_key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _write_pickle_atomic(path: Path, value: Any) -> None:
+    """Write via a temp file + rename so concurrent readers never see a partial file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=5)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.warning(f"Could not write disk cache entry {path}: {e}")
+
+
 def clear_leaderboard_cache() -> None:
     """Clear leaderboard caches. Alias for invalidate_on_result_change()."""
     invalidate_on_result_change()
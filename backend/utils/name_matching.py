@@ -5,30 +5,42 @@ Handles player name matching with fuzzy logic for grading.
 
 import difflib
 import logging
-from typing import Tuple
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-def names_match(picked_name: str, actual_name: str, threshold: float = 0.75) -> bool:
-    """
-    Compare two player names with fuzzy matching.
-    Handles variations like "CMC" vs "Christian McCaffrey", "Penix Jr" vs "Michael Penix Jr", 
-    "Puka Nacua" vs "P.Nacua", etc.
-    
-    Args:
-        picked_name: Name as picked by user
-        actual_name: Actual player name from play-by-play data
-        threshold: Similarity threshold (0-1, default 0.75)
-        
-    Returns:
-        True if names match or are similar enough
-    """
-    if not picked_name or not actual_name:
-        return False
-    
-    p = str(picked_name).strip().lower()
-    a = str(actual_name).strip().lower()
+_NAME_SUFFIXES = frozenset({'jr', 'sr', 'iii', 'iv', 'v', 'jr.', 'sr.'})
+
+
+def _get_last_name(parts: Tuple[str, ...]) -> str:
+    """Extract last name more intelligently (handles "P.Nacua")."""
+    if not parts:
+        return ""
+    last_part = parts[-1]
+    if '.' in last_part and len(last_part) > 2:
+        period_parts = [part for part in last_part.split('.') if part]
+        return period_parts[-1] if period_parts else last_part
+    return last_part
+
+
+@lru_cache(maxsize=8192)
+def _name_key(name: str) -> Tuple[str, Tuple[str, ...], str]:
+    """Lowercased name, its parts without suffixes, and its last name (cached per spelling)."""
+    lowered = name.strip().lower()
+    parts = tuple(part for part in lowered.split() if part not in _NAME_SUFFIXES)
+    return lowered, parts, _get_last_name(parts)
+
+
+def _keys_match(
+    p_key: Tuple[str, Tuple[str, ...], str],
+    a_key: Tuple[str, Tuple[str, ...], str],
+    threshold: float,
+    matcher: Optional[difflib.SequenceMatcher] = None
+) -> bool:
+    p, p_parts, p_last = p_key
+    a, a_parts, a_last = a_key
     
     # Exact match
     if p == a:
@@ -38,28 +50,6 @@ def names_match(picked_name: str, actual_name: str, threshold: float = 0.75) ->
     if p in a or a in p:
         return True
     
-    p_parts = p.split()
-    a_parts = a.split()
-    
-    # Remove common suffixes for comparison
-    suffixes = {'jr', 'sr', 'iii', 'iv', 'v', 'jr.', 'sr.'}
-    p_parts = [part for part in p_parts if part not in suffixes]
-    a_parts = [part for part in a_parts if part not in suffixes]
-    
-    # Extract last name more intelligently
-    def get_last_name(parts):
-        if not parts:
-            return ""
-        last_part = parts[-1]
-        # Handle "P.Nacua"
-        if '.' in last_part and len(last_part) > 2:
-            period_parts = [part for part in last_part.split('.') if part]
-            return period_parts[-1] if period_parts else last_part
-        return last_part
-    
-    p_last = get_last_name(p_parts)
-    a_last = get_last_name(a_parts)
-    
     # Check if last names match exactly
     if p_last and a_last and p_last == a_last:
         # If both have first parts, verify they are compatible (first initial match)
@@ -81,8 +71,51 @@ def names_match(picked_name: str, actual_name: str, threshold: float = 0.75) ->
             return True
     
     # Fuzzy matching using SequenceMatcher
-    ratio = difflib.SequenceMatcher(None, p, a).ratio()
-    return ratio >= threshold
+    if matcher is None:
+        return difflib.SequenceMatcher(None, p, a).ratio() >= threshold
+    matcher.set_seq1(p)
+    return matcher.ratio() >= threshold
+
+
+def names_match(picked_name: str, actual_name: str, threshold: float = 0.75) -> bool:
+    """
+    Compare two player names with fuzzy matching.
+    Handles variations like "CMC" vs "Christian McCaffrey", "Penix Jr" vs "Michael Penix Jr", 
+    "Puka Nacua" vs "P.Nacua", etc.
+    
+    Args:
+        picked_name: Name as picked by user
+        actual_name: Actual player name from play-by-play data
+        threshold: Similarity threshold (0-1, default 0.75)
+        
+    Returns:
+        True if names match or are similar enough
+    """
+    if not picked_name or not actual_name:
+        return False
+    return _keys_match(_name_key(str(picked_name)), _name_key(str(actual_name)), threshold)
+
+
+def names_matcher(actual_name: str, threshold: float = 0.75) -> Callable[[str], bool]:
+    """
+    Build a names_match(picked, actual_name) predicate for one fixed actual name.
+
+    Use when comparing many candidates against the same name (e.g. every
+    market player against a game's first TD scorer): the actual name is
+    normalized once, and the SequenceMatcher keeps its analysis of it between calls.
+    """
+    if not actual_name:
+        return lambda picked_name: False
+    a_key = _name_key(str(actual_name))
+    matcher = difflib.SequenceMatcher(None)
+    matcher.set_seq2(a_key[0])
+    
+    def match(picked_name: str) -> bool:
+        if not picked_name:
+            return False
+        return _keys_match(_name_key(str(picked_name)), a_key, threshold, matcher)
+    
+    return match
 
 
 def normalize_player_name(name: str) -> str:
@@ -1,6 +1,7 @@
 """
 Resilience Utilities
-Retry with exponential backoff and a lightweight circuit breaker.
+Retry with exponential backoff, a lightweight circuit breaker and a
+per-host token-bucket rate limiter.
 """
 
 from __future__ import annotations
@@ -8,10 +9,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Dict, Iterable, Optional, Tuple, TypeVar
 import random
+import threading
 import time
 
 T = TypeVar("T")
 
+# Longest Retry-After / X-RateLimit-Reset wait honoured. A server asking for
+# more (or a skewed epoch reset) ends the retries instead of parking the thread.
+MAX_RETRY_AFTER_SECONDS = 30.0
+
 
 class CircuitBreakerOpen(RuntimeError):
     """Raised when a circuit breaker is open."""
@@ -51,6 +57,7 @@ class CircuitBreaker:
 
 
 _BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
 
 
 def get_circuit_breaker(
@@ -58,16 +65,111 @@ def get_circuit_breaker(
     failure_threshold: int,
     cooldown_seconds: int,
 ) -> CircuitBreaker:
-    if key not in _BREAKERS:
-        _BREAKERS[key] = CircuitBreaker(failure_threshold, cooldown_seconds)
-    return _BREAKERS[key]
-
-
-def _sleep_backoff(attempt: int, base: float, factor: float, jitter: float) -> None:
+    breaker = _BREAKERS.get(key)
+    if breaker is None:
+        # Locked so concurrent first calls can't create two breakers for one key
+        with _BREAKERS_LOCK:
+            breaker = _BREAKERS.get(key)
+            if breaker is None:
+                breaker = _BREAKERS[key] = CircuitBreaker(failure_threshold, cooldown_seconds)
+    return breaker
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every caller hitting one host.
+
+    ``rate`` tokens are added per second up to ``burst``; acquire() blocks
+    until a token is free. pause() holds all callers back (e.g. for a 429's
+    Retry-After) so parallel requests stop hammering a throttled host.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token (possibly going into debt) and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        seconds = min(seconds, MAX_RETRY_AFTER_SECONDS)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(key: str, rate: float, burst: Optional[float] = None) -> RateLimiter:
+    limiter = _LIMITERS.get(key)
+    if limiter is None:
+        with _LIMITERS_LOCK:
+            limiter = _LIMITERS.get(key)
+            if limiter is None:
+                limiter = _LIMITERS[key] = RateLimiter(rate, burst)
+    return limiter
+
+
+def _retry_after_seconds(result: object) -> Optional[float]:
+    """Seconds from a response's Retry-After (or X-RateLimit-Reset) header, if numeric."""
+    headers = getattr(result, "headers", None)
+    if not headers:
+        return None
+    for name in ("Retry-After", "X-RateLimit-Reset"):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            continue
+        if seconds > 1e9:
+            # X-RateLimit-Reset is sometimes an epoch timestamp
+            seconds -= time.time()
+        return max(0.0, seconds)
+    return None
+
+
+def _backoff_delay(
+    attempt: int,
+    base: float,
+    factor: float,
+    jitter: float,
+    cap: Optional[float] = None,
+    full_jitter: bool = False,
+) -> float:
     delay = base * (factor ** attempt)
+    if cap is not None:
+        delay = min(cap, delay)
+    if full_jitter:
+        # "Full jitter": spread retries uniformly over the whole backoff window
+        return random.uniform(0, delay)
     if jitter > 0:
         delay += random.uniform(0, jitter)
-    time.sleep(delay)
+    return delay
+
+
+def _sleep_backoff(attempt: int, base: float, factor: float, jitter: float) -> None:
+    time.sleep(_backoff_delay(attempt, base, factor, jitter))
 
 
 def request_with_retry(
@@ -79,28 +181,66 @@ def request_with_retry(
     jitter: float,
     retry_on_statuses: Optional[Iterable[int]] = None,
     get_status: Optional[Callable[[T], Optional[int]]] = None,
+    backoff_cap: Optional[float] = None,
+    full_jitter: bool = False,
+    deadline: Optional[float] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    discard: Optional[Callable[[T], None]] = None,
 ) -> T:
+    """
+    Call request_fn, retrying failures and retryable statuses with backoff.
+
+    ``deadline`` is a time.monotonic() value; a retry whose backoff would
+    end past it is skipped and the last result/exception is surfaced.
+
+    ``rate_limiter`` is acquired before every attempt. A retryable response
+    carrying Retry-After waits at least that long and pauses the limiter so
+    other callers on the same host back off too. Waits beyond
+    MAX_RETRY_AFTER_SECONDS are not slept: the response is returned as is.
+
+    ``discard`` is called on a retryable response before it is thrown away
+    for a retry (e.g. to close a streamed response's connection).
+    """
     if not breaker.allow_request():
         raise CircuitBreakerOpen("Circuit breaker open")
 
+    def _retry_delay(attempt: int, min_delay: float = 0.0) -> Optional[float]:
+        if attempt >= retries:
+            return None
+        delay = max(min_delay, _backoff_delay(attempt, backoff_base, backoff_factor, jitter, backoff_cap, full_jitter))
+        if deadline is not None and time.monotonic() + delay > deadline:
+            return None
+        return delay
+
     last_exc: Optional[Exception] = None
 
     for attempt in range(retries + 1):
         try:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
             result = request_fn()
             status = get_status(result) if get_status else None
             if status is not None and retry_on_statuses and status in retry_on_statuses:
                 breaker.record_failure()
-                if attempt < retries:
-                    _sleep_backoff(attempt, backoff_base, backoff_factor, jitter)
+                retry_after = _retry_after_seconds(result)
+                if retry_after and rate_limiter is not None:
+                    rate_limiter.pause(retry_after)
+                if retry_after is not None and retry_after > MAX_RETRY_AFTER_SECONDS:
+                    return result
+                delay = _retry_delay(attempt, retry_after or 0.0)
+                if delay is not None:
+                    if discard is not None:
+                        discard(result)
+                    time.sleep(delay)
                     continue
             breaker.record_success()
             return result
         except Exception as exc:  # noqa: BLE001 - handled retry flow
             last_exc = exc
             breaker.record_failure()
-            if attempt < retries:
-                _sleep_backoff(attempt, backoff_base, backoff_factor, jitter)
+            delay = _retry_delay(attempt)
+            if delay is not None:
+                time.sleep(delay)
                 continue
             raise
 
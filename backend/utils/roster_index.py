@@ -0,0 +1,89 @@
+"""
+Roster Index Utilities
+Lowercase player name -> teams lookups built from roster DataFrames.
+"""
+
+import sys
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+# id(roster_df) -> (weak ref to the frame, row count, roster index, extras).
+# load_rosters hands back the same cached frame, so repeated lookups reuse
+# one index; entries drop when the frame is collected. ``extras`` holds
+# lookups callers derive from the index (see roster_index_extras).
+_ROSTER_INDEX_CACHE: Dict[int, Tuple[weakref.ref, int, Dict[str, Tuple[str, ...]], Dict[str, Any]]] = {}
+
+
+def lowercase_roster_names(roster_df: pd.DataFrame) -> pd.Series:
+    """Lowercased full names, reusing load_rosters' full_name_lc column when present."""
+    if 'full_name_lc' in roster_df.columns:
+        return roster_df['full_name_lc']
+    return roster_df['full_name'].str.lower()
+
+
+def build_roster_index(roster_df: pd.DataFrame) -> Dict[str, Tuple[str, ...]]:
+    """
+    Build a lowercase player name -> teams lookup from a roster DataFrame.
+
+    Building this once per batch turns each roster check into a single dict
+    probe instead of lowercasing and scanning the whole roster per pick.
+
+    Args:
+        roster_df: NFL roster DataFrame with full_name and team columns
+
+    Returns:
+        Dict mapping lowercased full name to the player's teams (roster order)
+    """
+    if roster_df.empty:
+        return {}
+
+    index: Dict[str, Dict[str, None]] = {}
+    names = lowercase_roster_names(roster_df).to_numpy()
+    # ~32 distinct team codes across thousands of rows: intern them so every
+    # entry shares one string object (and team membership hits the identity fast path)
+    teams = [sys.intern(t) if isinstance(t, str) else t for t in roster_df['team'].to_numpy()]
+    for name, roster_team in zip(names, teams):
+        if isinstance(name, str):
+            index.setdefault(name, {})[roster_team] = None
+
+    # Most players share a single-team tuple; reuse one tuple per distinct team set
+    shared: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    roster_index: Dict[str, Tuple[str, ...]] = {}
+    for name, player_teams in index.items():
+        team_tuple = tuple(player_teams)
+        roster_index[name] = shared.setdefault(team_tuple, team_tuple)
+    return roster_index
+
+
+def get_roster_index(roster_df: pd.DataFrame) -> Dict[str, Tuple[str, ...]]:
+    """Return the roster index for roster_df, reusing it while the frame is unchanged in size."""
+    key = id(roster_df)
+    entry = _ROSTER_INDEX_CACHE.get(key)
+    if entry is not None and entry[0]() is roster_df and entry[1] == len(roster_df):
+        return entry[2]
+
+    index = build_roster_index(roster_df)
+    try:
+        ref = weakref.ref(roster_df, lambda _ref, key=key: _ROSTER_INDEX_CACHE.pop(key, None))
+    except TypeError:
+        return index
+    _ROSTER_INDEX_CACHE[key] = (ref, len(roster_df), index, {})
+    return index
+
+
+def roster_index_extras(
+    roster_df: pd.DataFrame,
+    roster_index: Dict[str, Tuple[str, ...]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the mutable dict cached alongside roster_df's index, or None.
+
+    Callers store lookups derived from the index here so they live and die
+    with it. None means roster_index is not the cached index for this frame.
+    """
+    entry = _ROSTER_INDEX_CACHE.get(id(roster_df))
+    if entry is None or entry[0]() is not roster_df or entry[2] is not roster_index:
+        return None
+    return entry[3]
@@ -3,9 +3,101 @@ Team Utilities
 Helper functions for team name and abbreviation mapping
 """
 
+import re
+from typing import List, Optional, Tuple
+
 import backend.config as config
 
 
+def _build_team_mention_index():
+    """
+    Build the lookup used by find_team_abbrs.
+
+    Full names, nicknames ("Chiefs") and city names match case-insensitively;
+    abbreviations only match in uppercase so words like "no" or "ten" don't.
+    Longer names are tried first ("Green Bay Packers" before "Green Bay").
+    """
+    names = {}
+    for abbr, full_name in config.TEAM_MAP.items():
+        if full_name:
+            names[full_name.lower()] = abbr
+            names[full_name.rsplit(' ', 1)[-1].lower()] = abbr
+    for name, abbr in config.TEAM_ABBR_MAP.items():
+        if name:
+            names.setdefault(name.lower(), abbr)
+
+    name_alternation = '|'.join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+    abbr_alternation = '|'.join(sorted(config.TEAM_MAP, key=len, reverse=True))
+    pattern = re.compile(rf"\b(?:(?i:{name_alternation})|{abbr_alternation})\b")
+    return names, pattern
+
+
+_TEAM_NAMES_LC, _TEAM_MENTION_RE = _build_team_mention_index()
+
+# Reverse of TEAM_ABBR_MAP. Built from the end so the first name listed per
+# abbreviation (the full name, ahead of the short city aliases) wins.
+_ABBR_TO_FULL_NAME = {abbr: name for name, abbr in reversed(config.TEAM_ABBR_MAP.items())}
+
+
+# Matchup separators, most specific first ("at" is an ordinary English word)
+_MATCHUP_SEPARATORS = [
+    re.compile(r'\s+vs\.?\s+', re.IGNORECASE),
+    re.compile(r'\s+@\s+'),
+    re.compile(r'\s+at\s+', re.IGNORECASE),
+]
+_IN_RE = re.compile(r'\s+in\s+', re.IGNORECASE)
+
+
+def _team_mentions(text: str) -> List[str]:
+    """Abbreviations of every team mention in text, in order (repeats included)."""
+    return [_TEAM_NAMES_LC.get(m.group(0).lower(), m.group(0)) for m in _TEAM_MENTION_RE.finditer(text)]
+
+
+def find_team_abbrs(text: str, limit: int = 2) -> List[str]:
+    """
+    Find the distinct teams mentioned in free text, in order of appearance.
+
+    Args:
+        text: Text to scan (e.g., "Will Travis Kelce score first in Chiefs vs Bills?")
+        limit: Stop after this many distinct teams
+
+    Returns:
+        Team abbreviations (e.g., ["KC", "BUF"])
+    """
+    found = []
+    for match in _TEAM_MENTION_RE.finditer(text):
+        mention = match.group(0)
+        abbr = _TEAM_NAMES_LC.get(mention.lower(), mention)
+        if abbr not in found:
+            found.append(abbr)
+            if len(found) >= limit:
+                break
+    return found
+
+
+def find_matchup_teams(text: str) -> Optional[Tuple[str, str]]:
+    """
+    Find the two teams of an "X vs/@/at Y" matchup in free text.
+
+    The matchup after the last " in " is tried first, then the whole text.
+    Each side is resolved on its own: the team nearest the separator on the
+    left, the first team on the right. This keeps a player named like a city
+    ("Dallas Goedert ... in Eagles vs Giants") from being taken for a team.
+
+    Returns:
+        (first_team, second_team) abbreviations, or None if no matchup is found
+    """
+    spans = [_IN_RE.split(text)[-1], text]
+    for span in dict.fromkeys(spans):
+        for separator in _MATCHUP_SEPARATORS:
+            for sep in separator.finditer(span):
+                left = _team_mentions(span[:sep.start()])
+                right = _team_mentions(span[sep.end():])
+                if left and right and left[-1] != right[0]:
+                    return left[-1], right[0]
+    return None
+
+
 def get_team_abbr(full_name: str) -> str:
     """
     Maps full team names (Odds API format) to abbreviations (nflreadpy format).
@@ -29,10 +121,7 @@ def get_team_full_name(abbr: str) -> str:
     Returns:
         Full team name (e.g., "Kansas City Chiefs")
     """
-    for name, a in config.TEAM_ABBR_MAP.items():
-        if a == abbr:
-            return name
-    return abbr
+    return _ABBR_TO_FULL_NAME.get(abbr, abbr)
 
 
 def backfill_team_for_picks(season: int) -> dict:
@@ -59,12 +148,14 @@ def backfill_team_for_picks(season: int) -> dict:
     import logging
     from backend.database import get_db_connection
     from backend.analytics.nfl_data import load_rosters
+    from backend.utils.roster_index import build_roster_index
     from backend.utils.name_matching import names_match
     
     logger = logging.getLogger(__name__)
     updated = 0
     failed = 0
     duplicates = 0
+    update_rows: List[Tuple[str, int]] = []
     
     try:
         conn = get_db_connection()
@@ -92,62 +183,53 @@ def backfill_team_for_picks(season: int) -> dict:
             logger.error(f"No roster data available for season {season}")
             return {'updated': 0, 'failed': len(unknown_picks), 'duplicates': 0}
         
+        # Flatten the roster once: exact (lowercased) names resolve with a dict
+        # probe, and only misses fall back to fuzzy matching over distinct names.
+        roster_index = build_roster_index(rosters_df)
+        
         for pick in unknown_picks:
             pick_id, player_name, _, user_name = pick
             
-            # Search for player in rosters to find their team
-            found_team = None
+            key = str(player_name or '').strip().lower()
+            roster_teams = roster_index.get(key)
+            found_team = roster_teams[0] if roster_teams else None
             
-            for _, roster_player in rosters_df.iterrows():
-                roster_full_name = roster_player.get('full_name', '')
-                if not roster_full_name:
-                    continue
-                
-                # Use our existing name matching logic
-                if names_match(player_name, roster_full_name, threshold=0.70):
-                    found_team = roster_player.get('team')
-                    logger.info(f"Matched '{player_name}' → '{roster_full_name}' ({found_team})")
-                    break  # Take first match
+            if found_team is None:
+                # Use our existing name matching logic (first match in roster order)
+                for roster_name, teams in roster_index.items():
+                    if names_match(player_name, roster_name, threshold=0.70):
+                        found_team = teams[0]
+                        logger.info(f"Matched '{player_name}' → '{roster_name}' ({found_team})")
+                        break
             
-            # Update pick if team was found
             if found_team:
-                try:
-                    cursor.execute(
-                        "UPDATE picks SET team = ? WHERE id = ?",
-                        (found_team, pick_id)
-                    )
-                    updated += 1
-                except Exception as e:
-                    logger.error(f"Failed to update pick {pick_id}: {e}")
-                    failed += 1
+                update_rows.append((found_team, pick_id))
             else:
                 failed += 1
                 logger.warning(f"Could not find team for {player_name} (user: {user_name})")
         
-        # Remove duplicate picks (keep first, delete rest)
+        # Apply all resolved teams in one statement; updates and deletes
+        # share the transaction committed below
+        if update_rows:
+            cursor.executemany("UPDATE picks SET team = ? WHERE id = ?", update_rows)
+            updated = len(update_rows)
+        
+        # Remove duplicate picks (keep the earliest of each user/week/player/team
+        # group, delete the rest) in one statement
         cursor.execute("""
-            SELECT p.id, p.user_id, p.week_id, COUNT(*) as count
-            FROM picks p
-            JOIN weeks w ON p.week_id = w.id
-            WHERE w.season = ?
-            GROUP BY p.user_id, p.week_id, p.player_name, p.team
-            HAVING count > 1
+            DELETE FROM picks WHERE id IN (
+                SELECT id FROM (
+                    SELECT p.id, ROW_NUMBER() OVER (
+                        PARTITION BY p.user_id, p.week_id, p.player_name, p.team
+                        ORDER BY p.created_at ASC, p.id ASC
+                    ) AS rn
+                    FROM picks p
+                    JOIN weeks w ON p.week_id = w.id
+                    WHERE w.season = ?
+                ) WHERE rn > 1
+            )
         """, (season,))
-        
-        duplicate_groups = cursor.fetchall()
-        for group in duplicate_groups:
-            pick_id, user_id, week_id, count = group
-            # Get all picks in this duplicate group and delete the later ones
-            cursor.execute("""
-                SELECT p.id FROM picks p
-                WHERE p.user_id = ? AND p.week_id = ?
-                ORDER BY p.created_at DESC
-            """, (user_id, week_id))
-            
-            picks_to_delete = cursor.fetchall()[1:]  # Keep first, delete rest
-            for dup_pick in picks_to_delete:
-                cursor.execute("DELETE FROM picks WHERE id = ?", (dup_pick[0],))
-                duplicates += 1
+        duplicates = cursor.rowcount
         
         conn.commit()
         